@@ -29,3 +29,10 @@ class UserDoesNotExistError(UserException):
         self.status_code = 404
         self.error = "user_does_not_exist_error"
         self.description = f"Пользователя {user_id} не существует"
+
+
+class PasswordHasherOverloadedError(BaseLeakyException):
+    def __init__(self):
+        self.status_code = 503
+        self.error = "temporarily_unavailable"
+        self.description = "Сервер перегружен, повторите запрос позже"
@@ -1,3 +1,4 @@
+from functools import partial
 from pathlib import Path
 
 from fastapi import FastAPI, Request
@@ -6,15 +7,27 @@ from fastapi.responses import ORJSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from tortoise.contrib.fastapi import register_tortoise
 
-from .exceptions import BaseLeakyException, UserExistsError
-from .oauth.exceptions import AuthError, ProtoException
-from .oauth.routes import router as auth_router
+from .exceptions import BaseLeakyException, UserExistsError, PasswordHasherOverloadedError
+from .migrations import check_schema_version
+from .monitoring.routes import router as metrics_router
+from .oauth.exceptions import AuthError, ProtoException, BaseOauthError
+from .oauth.codes import code_purge_job
+from .oauth.refresh import refresh_purge_job
+from .oauth.routes import router as auth_router, registration_form
+from .utils.invalidation import invalidation_bus
+from .utils.revocation import revocation_list, revocation_purge_job
+from .utils.security import password_hasher
 from .utils.settings import TORTOISE_ORM
+from .utils.timing_wheel import expiry_wheel
 from .users_management.routes import router as users_router
+from .well_known.metadata import metadata_documents
+from .well_known.routes import router as well_known_router
 
 app = FastAPI()
 app.include_router(auth_router)
 app.include_router(users_router)
+app.include_router(well_known_router)
+app.include_router(metrics_router)
 app.mount('/static', StaticFiles(directory=Path(__file__).parent / 'static'), name='static')
 
 app.add_middleware(
@@ -39,6 +52,15 @@ async def process_user_exist_error(request: Request, exc: UserExistsError):
     )
 
 
+@app.exception_handler(PasswordHasherOverloadedError)
+async def process_overload_error(request: Request, exc: PasswordHasherOverloadedError):
+    return ORJSONResponse(
+            status_code=exc.status_code,
+            content={"error": exc.error, "description": exc.description},
+            headers={"Retry-After": "1"}
+    )
+
+
 @app.exception_handler(BaseLeakyException)
 async def process_exception(request: Request, exc: BaseLeakyException):
     return ORJSONResponse(
@@ -52,10 +74,34 @@ async def process_auth_exception(request: Request, exc: AuthError):
     return RedirectResponse(await exc.get_redirect_uri(), status_code=exc.status_code)
 
 
+@app.exception_handler(BaseOauthError)
+async def process_oauth_exception(request: Request, exc: BaseOauthError):
+    return ORJSONResponse(status_code=exc.status_code, content={"error": exc.error, "description": exc.description},
+                          headers={'Cache-Control': 'no-store', 'Pragma': 'no-cache'})
+
+
 @app.exception_handler(ProtoException)
 async def process_exception(request: Request, exc: ProtoException):
     return ORJSONResponse(status_code=400, content=exc.to_dict(),
                           headers={'Cache-Control': 'no-store', 'Pragma': 'no-cache'})
 
 
-register_tortoise(app, config=TORTOISE_ORM, generate_schemas=True)
+app.add_event_handler("startup", partial(metadata_documents.build, app))
+app.add_event_handler("startup", registration_form.prepare)
+app.add_event_handler("startup", invalidation_bus.start)
+app.add_event_handler("startup", expiry_wheel.start)
+app.add_event_handler("startup", code_purge_job.start)
+app.add_event_handler("startup", refresh_purge_job.start)
+app.add_event_handler("startup", revocation_purge_job.start)
+app.add_event_handler("shutdown", invalidation_bus.stop)
+app.add_event_handler("shutdown", code_purge_job.stop)
+app.add_event_handler("shutdown", refresh_purge_job.stop)
+app.add_event_handler("shutdown", revocation_purge_job.stop)
+app.add_event_handler("shutdown", expiry_wheel.stop)
+app.add_event_handler("shutdown", password_hasher.shutdown)
+
+# Схему создают миграции (python -m dev.migrate admin_server), воркер только сверяет версию
+register_tortoise(app, config=TORTOISE_ORM, generate_schemas=False)
+# Нужна инициализированная Tortoise, поэтому после register_tortoise
+app.add_event_handler("startup", check_schema_version)
+app.add_event_handler("startup", revocation_list.load)
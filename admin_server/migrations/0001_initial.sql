@@ -0,0 +1,107 @@
+-- Схема, которую до перехода на миграции создавал generate_schemas. Всё через IF NOT EXISTS:
+-- на базе, созданной generate_schemas, миграция ничего не меняет, только фиксирует версию.
+CREATE TABLE IF NOT EXISTS "authorizationcodes" (
+    "code_hash" VARCHAR(64) NOT NULL PRIMARY KEY,
+    "client_id" UUID NOT NULL,
+    "user_id" UUID NOT NULL,
+    "redirect_uri" VARCHAR(2083) NOT NULL,
+    "scope" VARCHAR(255) NOT NULL DEFAULT '',
+    "nonce" VARCHAR(255),
+    "expires_at" TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_authorizati_expires_613562" ON "authorizationcodes" ("expires_at");
+COMMENT ON COLUMN "authorizationcodes"."code_hash" IS 'SHA-256 of the authorization code, the code itself is not stored.';
+CREATE TABLE IF NOT EXISTS "clients" (
+    "client_id" UUID NOT NULL PRIMARY KEY,
+    "client_id_issued_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "client_secret" VARCHAR(2048),
+    "client_secret_expires_at" TIMESTAMPTZ,
+    "token_endpoint_auth_method" VARCHAR(19) NOT NULL DEFAULT 'client_secret_basic',
+    "scope" VARCHAR(255) NOT NULL DEFAULT '',
+    "jwks_uri" VARCHAR(255),
+    "software_id" UUID,
+    "software_version" VARCHAR(255)
+);
+COMMENT ON COLUMN "clients"."client_id" IS 'OAuth 2.0 client identifier string.';
+COMMENT ON COLUMN "clients"."token_endpoint_auth_method" IS 'String indicator of the requested authentication method for the token endpoint. Possible values are: "none", "client_secret_post", "client_secret_basic". If not provided, the default is "client_secret_basic"';
+COMMENT ON COLUMN "clients"."scope" IS 'String containing a space-separated list of scope values that the client can use when requesting access tokens.';
+COMMENT ON COLUMN "clients"."jwks_uri" IS 'URL string referencing the client''s JSON Web Key (JWK) Set document, which contains the client''s public keys. The "jwks_uri" and "jwks" parameters MUST NOT both be present in the same request or response';
+COMMENT ON COLUMN "clients"."software_id" IS 'A UUID assigned by the client developer or software publisher used by registration endpoints to identify the client software to be dynamically registered.';
+COMMENT ON COLUMN "clients"."software_version" IS 'A version identifier string for the client software identified by "software_id".';
+CREATE TABLE IF NOT EXISTS "clientlocalizations" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "field" VARCHAR(16) NOT NULL,
+    "lang_tag" VARCHAR(16) NOT NULL DEFAULT '',
+    "value" VARCHAR(2083) NOT NULL,
+    "client_id" UUID NOT NULL REFERENCES "clients" ("client_id") ON DELETE CASCADE,
+    CONSTRAINT "uid_clientlocal_client__49fbc0" UNIQUE ("client_id", "field", "lang_tag")
+);
+COMMENT ON COLUMN "clientlocalizations"."field" IS 'client_name, tos_uri, policy_uri, logo_uri or client_uri';
+COMMENT ON COLUMN "clientlocalizations"."lang_tag" IS 'BCP 47 language tag, empty for the value without a tag';
+COMMENT ON TABLE "clientlocalizations" IS 'Локализуемые метаданные клиента: одна строка на заданное значение, "client_name#ja-JP"';
+CREATE TABLE IF NOT EXISTS "contacts" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "contact" VARCHAR(255),
+    "client_id" UUID NOT NULL REFERENCES "clients" ("client_id") ON DELETE CASCADE,
+    CONSTRAINT "uid_contacts_client__5ec064" UNIQUE ("client_id", "contact")
+);
+COMMENT ON COLUMN "contacts"."contact" IS 'Array of strings representing ways to contact people responsible for this client, typically email addresses.';
+CREATE TABLE IF NOT EXISTS "granttypes" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "grant_type" VARCHAR(45) NOT NULL DEFAULT 'authorization_code',
+    "client_id" UUID NOT NULL REFERENCES "clients" ("client_id") ON DELETE CASCADE,
+    CONSTRAINT "uid_granttypes_client__8a0e04" UNIQUE ("client_id", "grant_type")
+);
+COMMENT ON COLUMN "granttypes"."grant_type" IS 'Array of OAuth 2.0 grant type strings that the client can use at the token endpoint';
+CREATE TABLE IF NOT EXISTS "jwks" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "jwk" VARCHAR(16384),
+    "client_id" UUID NOT NULL REFERENCES "clients" ("client_id") ON DELETE CASCADE,
+    CONSTRAINT "uid_jwks_client__933491" UNIQUE ("client_id", "jwk")
+);
+COMMENT ON COLUMN "jwks"."jwk" IS 'Client''s JSON Web Key [RFC7517] document value, which contains the client''s public keys. The "jwks_uri" and "jwks" parameters MUST NOT both be present in the same request or response';
+CREATE TABLE IF NOT EXISTS "redirecturis" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "redirect_uri" VARCHAR(255) NOT NULL,
+    "client_id" UUID NOT NULL REFERENCES "clients" ("client_id") ON DELETE CASCADE,
+    CONSTRAINT "uid_redirecturi_client__b99b3a" UNIQUE ("client_id", "redirect_uri")
+);
+COMMENT ON COLUMN "redirecturis"."redirect_uri" IS 'Array of redirection URI strings for use in redirect-based flows such as the authorization code and implicit flows.';
+CREATE TABLE IF NOT EXISTS "refreshtokens" (
+    "token_hash" VARCHAR(64) NOT NULL PRIMARY KEY,
+    "family_id" UUID NOT NULL,
+    "client_id" UUID NOT NULL,
+    "user_id" UUID,
+    "scope" VARCHAR(255) NOT NULL DEFAULT '',
+    "used" BOOL NOT NULL DEFAULT False,
+    "expires_at" TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_refreshtoke_family__63b76b" ON "refreshtokens" ("family_id");
+CREATE INDEX IF NOT EXISTS "idx_refreshtoke_expires_8e8bbd" ON "refreshtokens" ("expires_at");
+COMMENT ON COLUMN "refreshtokens"."token_hash" IS 'SHA-256 of the refresh token.';
+COMMENT ON COLUMN "refreshtokens"."family_id" IS 'All tokens rotated from the same grant share a family.';
+CREATE TABLE IF NOT EXISTS "responsetypes" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "response_type" VARCHAR(5) NOT NULL DEFAULT 'code',
+    "client_id" UUID NOT NULL REFERENCES "clients" ("client_id") ON DELETE CASCADE,
+    CONSTRAINT "uid_responsetyp_client__efdbc7" UNIQUE ("client_id", "response_type")
+);
+COMMENT ON COLUMN "responsetypes"."response_type" IS 'Array of the OAuth 2.0 response type strings that the client can use at the authorization endpoint.';
+CREATE TABLE IF NOT EXISTS "revokedtokens" (
+    "jti" VARCHAR(64) NOT NULL PRIMARY KEY,
+    "expires_at" TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_revokedtoke_expires_3cdc77" ON "revokedtokens" ("expires_at");
+COMMENT ON COLUMN "revokedtokens"."expires_at" IS 'exp of the revoked token, the row is purged after it.';
+CREATE TABLE IF NOT EXISTS "users" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "name" VARCHAR(64),
+    "surname" VARCHAR(64),
+    "patronymic" VARCHAR(64)
+);
+CREATE TABLE IF NOT EXISTS "creds" (
+    "login" VARCHAR(255) NOT NULL,
+    "passwd" VARCHAR(60) NOT NULL,
+    "user_id" UUID NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS "idx_creds_user_id_617ba0" ON "creds" ("user_id");
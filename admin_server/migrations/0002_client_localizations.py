@@ -0,0 +1,43 @@
+# Перенос локализаций клиентов из широких таблиц (clientname, tosuri, policyuri, logouri, clienturi —
+# по колонке на каждый язык) в clientlocalizations. Таблиц может не быть (база создана уже после
+# перехода) — тогда ничего не делает. Старые таблицы не удаляются.
+from admin_server.models import ClientLocalizations
+from admin_server.utils.i18n import lang_tags
+
+wide_tables = {
+    'client_name': 'clientname',
+    'tos_uri': 'tosuri',
+    'policy_uri': 'policyuri',
+    'logo_uri': 'logouri',
+    'client_uri': 'clienturi',
+}
+
+
+def wide_columns(field: str) -> dict[str, str]:
+    """Колонка широкой таблицы -> lang_tag ("" для значения без языка)."""
+    columns = {field: ""}
+    columns.update({f"{field}_{tag.lower().replace('-', '_')}": tag for tag in lang_tags})
+    return columns
+
+
+async def existing_tables(conn) -> dict[str, str]:
+    # Через каталог, а не пробным SELECT: ошибка запроса в Postgres обрывает всю транзакцию
+    if conn.capabilities.dialect == 'postgres':
+        query = "SELECT tablename FROM pg_tables WHERE schemaname = current_schema()"
+    else:
+        query = "SELECT name FROM sqlite_master WHERE type = 'table'"
+    _, rows = await conn.execute_query(query)
+    present = {row[0] for row in rows}
+    return {field: table for field, table in wide_tables.items() if table in present}
+
+
+async def upgrade(conn):
+    for field, table in (await existing_tables(conn)).items():
+        columns = wide_columns(field)
+        rows = await conn.execute_query_dict(f'SELECT * FROM "{table}"')
+        localizations = [ClientLocalizations(client_id=row['client_id'], field=field, lang_tag=columns[column],
+                                             value=value)
+                         for row in rows for column, value in row.items()
+                         if column in columns and value is not None]
+        await ClientLocalizations.bulk_create(localizations, batch_size=1000, ignore_conflicts=True, using_db=conn)
+        print(f"{table}: {len(rows)} rows -> {len(localizations)} localizations")
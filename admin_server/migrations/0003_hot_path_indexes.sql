@@ -0,0 +1,3 @@
+-- Creds.get_or_none(login=...) на каждом входе и регистрации пользователя.
+-- redirecturis по client_id уже покрыт уникальным индексом (client_id, redirect_uri).
+CREATE INDEX IF NOT EXISTS "idx_creds_login_f3cce7" ON "creds" ("login");
@@ -0,0 +1,36 @@
+import hmac
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from ..utils.cache import named_caches
+from ..utils.metrics import named_histograms
+from ..utils.revocation import revocation_list
+from ..utils.settings import get_settings
+
+
+async def verify_metrics_token(authorization: Annotated[str | None, Header()] = None):
+    # Без METRICS_TOKEN метрики не отдаются вовсе
+    if not (token := get_settings().metrics_token):
+        raise HTTPException(status_code=404)
+    scheme, _, credentials = (authorization or '').partition(' ')
+    if scheme.lower() != 'bearer' or not hmac.compare_digest(credentials.encode(), token.encode()):
+        raise HTTPException(status_code=401, detail='Not authenticated', headers={'WWW-Authenticate': 'Bearer'})
+
+
+router = APIRouter(prefix='/metrics', dependencies=[Depends(verify_metrics_token)], include_in_schema=False)
+
+
+@router.get('/caches')
+async def get_caches_stats():
+    return {name: cache.stats() for name, cache in named_caches.items()}
+
+
+@router.get('/revocations')
+async def get_revocation_stats():
+    return revocation_list.stats()
+
+
+@router.get('/latency')
+async def get_latency_stats():
+    return {name: histogram.stats() for name, histogram in named_histograms.items()}
@@ -0,0 +1,39 @@
+from uuid import UUID
+
+from .registry import ClientRecord, client_registry
+from ..utils.security import hash_client_secret, verify_client_secret
+
+
+# В записи реестра лежит хеш секрета из БД, поэтому повторная проверка
+# (с верным или неверным секретом) обходится без обращения к БД
+def check_client_secret(client: ClientRecord, secret: str) -> bool:
+    if not verify_client_secret(hash_client_secret(secret), client.secret_hash):
+        return False
+    remaining = client.seconds_until_expiry()
+    return remaining is None or remaining > 0
+
+
+def _parse_client_id(client_id: UUID | str) -> UUID | None:
+    if isinstance(client_id, UUID):
+        return client_id
+    try:
+        return UUID(client_id)
+    except ValueError:
+        return None
+
+
+async def authenticate_client(client_id: UUID | str, secret: str) -> ClientRecord | None:
+    if not (client_id := _parse_client_id(client_id)):
+        return None
+    if not (client := await client_registry.get(client_id)):
+        return None
+    return client if check_client_secret(client, secret) else None
+
+
+async def authenticate_clients(credentials: list[tuple[UUID, str]]) -> list[ClientRecord | None]:
+    clients = await client_registry.get_many({client_id for client_id, _ in credentials})
+    results = []
+    for client_id, secret in credentials:
+        client = clients.get(client_id)
+        results.append(client if client and check_client_secret(client, secret) else None)
+    return results
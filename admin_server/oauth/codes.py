@@ -0,0 +1,132 @@
+import datetime
+import hashlib
+import secrets
+import time
+from typing import NamedTuple
+from uuid import UUID
+
+from tortoise.transactions import in_transaction
+
+from ..models import AuthorizationCodes
+from ..utils.purge import PurgeJob
+from ..utils.settings import get_settings
+from ..utils.timing_wheel import Timer, TimingWheel, expiry_wheel
+
+
+class AuthorizationCode(NamedTuple):
+    code: str
+    client_id: UUID
+    user_id: UUID
+    redirect_uri: str
+    scope: str
+    nonce: str | None
+    expires_at: float  # unix time
+
+    def matches(self, client_id: UUID, redirect_uri: str) -> bool:
+        return self.client_id == client_id and self.redirect_uri == redirect_uri and time.time() < self.expires_at
+
+
+def generate_code() -> str:
+    return secrets.token_urlsafe(32)
+
+
+def hash_code(code: str) -> str:
+    return hashlib.sha256(code.encode()).hexdigest()
+
+
+class CodeStore:
+    # Нужен ли периодический PurgeJob
+    needs_purge = True
+
+    async def save(self, code: AuthorizationCode):
+        raise NotImplementedError
+
+    async def redeem(self, code: str, client_id: UUID, redirect_uri: str) -> AuthorizationCode | None:
+        """Атомарно забирает код: повторное предъявление того же кода всегда неуспешно,
+        даже если первое было отклонено из-за несовпадения client_id/redirect_uri."""
+        raise NotImplementedError
+
+    async def purge(self) -> int:
+        raise NotImplementedError
+
+    async def issue(self, client_id: UUID, user_id: UUID, redirect_uri: str, scope: str,
+                    nonce: str | None = None) -> str:
+        code = generate_code()
+        await self.save(AuthorizationCode(code=code, client_id=client_id, user_id=user_id,
+                                          redirect_uri=redirect_uri, scope=scope, nonce=nonce,
+                                          expires_at=time.time() + get_settings().auth_code_ttl))
+        return code
+
+
+class MemoryCodeStore(CodeStore):
+    """Коды живут секунды, поэтому на горячем пути нет записи в БД. Подходит для одного
+    воркера или sticky-балансировки: код погашается только тем процессом, что его выдал."""
+
+    owner = "auth_codes"
+    needs_purge = False
+
+    def __init__(self, wheel: TimingWheel = expiry_wheel):
+        self._codes: dict[str, tuple[AuthorizationCode, Timer]] = {}
+        self._wheel = wheel
+        wheel.register(self.owner, self._expire)
+
+    def _expire(self, codes: list[str]):
+        for code in codes:
+            self._codes.pop(code, None)
+
+    async def save(self, code: AuthorizationCode):
+        self._codes[code.code] = (code, self._wheel.schedule(self.owner, code.code, code.expires_at))
+
+    async def redeem(self, code: str, client_id: UUID, redirect_uri: str) -> AuthorizationCode | None:
+        # pop без await между проверкой и удалением — атомарно в рамках event loop
+        if not (item := self._codes.pop(code, None)):
+            return None
+        stored, timer = item
+        self._wheel.cancel(timer)
+        return stored if stored.matches(client_id, redirect_uri) else None
+
+    async def purge(self) -> int:
+        # Истёкшие коды убирает колесо таймеров
+        return 0
+
+
+class PostgresCodeStore(CodeStore):
+    async def save(self, code: AuthorizationCode):
+        async with in_transaction() as conn:
+            await AuthorizationCodes.create(code_hash=hash_code(code.code),
+                                            client_id=code.client_id,
+                                            user_id=code.user_id,
+                                            redirect_uri=code.redirect_uri,
+                                            scope=code.scope,
+                                            nonce=code.nonce,
+                                            expires_at=datetime.datetime.fromtimestamp(code.expires_at,
+                                                                                       datetime.timezone.utc),
+                                            using_db=conn)
+
+    async def redeem(self, code: str, client_id: UUID, redirect_uri: str) -> AuthorizationCode | None:
+        async with in_transaction() as conn:
+            stored = await AuthorizationCodes.filter(code_hash=hash_code(code)).using_db(
+                    conn).select_for_update().first()
+            if not stored:
+                return None
+            await stored.delete(using_db=conn)
+
+        redeemed = AuthorizationCode(code=code, client_id=stored.client_id, user_id=stored.user_id,
+                                     redirect_uri=stored.redirect_uri, scope=stored.scope, nonce=stored.nonce,
+                                     expires_at=stored.expires_at.timestamp())
+        return redeemed if redeemed.matches(client_id, redirect_uri) else None
+
+    async def purge(self) -> int:
+        async with in_transaction() as conn:
+            return await AuthorizationCodes.filter(
+                    expires_at__lt=datetime.datetime.now(datetime.timezone.utc)).using_db(conn).delete()
+
+
+def create_code_store() -> CodeStore:
+    if get_settings().auth_code_store == "postgres":
+        return PostgresCodeStore()
+    return MemoryCodeStore()
+
+
+code_store = create_code_store()
+code_purge_job = PurgeJob(code_store, get_settings().auth_code_purge_interval)
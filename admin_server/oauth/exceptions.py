@@ -72,6 +72,12 @@ class BaseOauthError(Exception):
     description: str = "Ошибка авторизации"
 
 
+# RFC 6749, 4.1.2.1: при неверном redirect_uri перенаправлять пользователя нельзя
+class RedirectURIMismatch(BaseOauthError):
+    error = "invalid_request"
+    description = "The redirection URI is invalid or does not match any of the client's registered URIs."
+
+
 class AuthError(BaseOauthError):
     status_code = 302
     error = "auth_error"
@@ -170,3 +176,25 @@ class TokenUnauthorizedClient(BaseOauthError):
 class TokenAccessDenied(BaseOauthError):
     error = "access_denied"
     description = "The resource owner or authorization server denied the request."
+
+
+class TokenInvalidClient(BaseOauthError):
+    status_code = 401
+    error = "invalid_client"
+    description = "Client authentication failed."
+
+
+class TokenInvalidScope(BaseOauthError):
+    error = "invalid_scope"
+    description = "The requested scope is invalid, unknown, malformed, or exceeds the scope granted."
+
+
+class TokenInvalidGrant(BaseOauthError):
+    error = "invalid_grant"
+    description = "The provided authorization grant is invalid, expired, revoked, does not match " \
+                  "the redirection URI used in the authorization request, or was issued to another client."
+
+
+class TokenUnsupportedGrantType(BaseOauthError):
+    error = "unsupported_grant_type"
+    description = "The authorization grant type is not supported by the authorization server."
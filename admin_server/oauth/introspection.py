@@ -0,0 +1,37 @@
+import hashlib
+import time
+
+from jose import JWTError
+
+from ..utils.cache import LRUCache
+from ..utils.metrics import LatencyHistogram
+from ..utils.revocation import revocation_list
+from ..utils.security import decode_jwt
+from ..utils.settings import get_settings
+
+# sha256 токена -> проверенные claims; запись живёт не дольше exp токена
+verified_tokens = LRUCache(get_settings().introspection_cache_size, name='introspection')
+introspection_latency = LatencyHistogram('introspection')
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def inactive() -> dict:
+    return {'active': False}
+
+
+async def introspect(token: str) -> dict:
+    digest = token_digest(token)
+    if (claims := verified_tokens.get(digest)) is None:
+        try:
+            claims = await decode_jwt(token)
+        except JWTError:
+            return inactive()
+        if isinstance(exp := claims.get('exp'), (int, float)):
+            verified_tokens.set(digest, claims, ttl=exp - time.time())
+    elif claims.get('exp', float('inf')) <= time.time() or revocation_list.is_revoked(claims.get('jti')):
+        return inactive()
+
+    return {'active': True, 'token_type': 'Bearer', **claims}
@@ -0,0 +1,80 @@
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+from urllib import parse
+
+# RFC 8252, 7.3: для loopback-адресов порт выбирает нативное приложение в момент запроса.
+# "localhost" не поддерживаем (RFC 8252, 8.3)
+loopback_hosts = frozenset({"127.0.0.1", "::1"})
+_default_ports = {"http": 80, "https": 443}
+
+
+def is_loopback_host(host: str | None) -> bool:
+    return bool(host) and host.strip("[]") in loopback_hosts
+
+
+class NormalizedURI(NamedTuple):
+    scheme: str
+    host: str
+    port: int | None  # None — порт по умолчанию для схемы
+    path: str  # вместе с query
+
+    def __str__(self):
+        host = f"[{self.host}]" if ":" in self.host else self.host
+        port = f":{self.port}" if self.port is not None else ""
+        return f"{self.scheme}://{host}{port}{self.path}"
+
+    @property
+    def is_loopback(self) -> bool:
+        return self.scheme == "http" and self.host in loopback_hosts
+
+
+@lru_cache(maxsize=4096)
+def normalize_redirect_uri(uri: str) -> NormalizedURI | None:
+    """Схема и хост в нижнем регистре, порт по умолчанию отбрасывается, пустой путь — "/".
+    Путь и query сравниваются побайтно. None — URI не может быть redirect_uri
+    (нет хоста, есть фрагмент, неподдерживаемая схема)."""
+    try:
+        parts = parse.urlsplit(uri)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in _default_ports or not parts.hostname or parts.fragment or parts.username or parts.password:
+        return None
+    if port == _default_ports[scheme]:
+        port = None
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return NormalizedURI(scheme, parts.hostname.lower(), port, path)
+
+
+class RedirectMatcher(NamedTuple):
+    """Зарегистрированные redirect_uri клиента, нормализованные один раз при загрузке.
+    Проверка входящего URI — один поиск в множестве: точное совпадение, а для
+    loopback-адресов — совпадение без учёта порта через индекс по хосту."""
+
+    exact: frozenset[NormalizedURI]
+    loopback: dict[str, frozenset[str]]  # хост -> пути
+
+    @classmethod
+    def from_uris(cls, uris: Iterable[str]) -> "RedirectMatcher":
+        exact, loopback = set(), {}
+        for uri in uris:
+            if not (normalized := normalize_redirect_uri(uri)):
+                continue
+            if normalized.is_loopback:
+                loopback.setdefault(normalized.host, set()).add(normalized.path)
+            else:
+                exact.add(normalized)
+        return cls(frozenset(exact), {host: frozenset(paths) for host, paths in loopback.items()})
+
+    def matches(self, uri: str) -> bool:
+        if not (normalized := normalize_redirect_uri(uri)):
+            return False
+        if normalized.is_loopback:
+            return normalized.path in self.loopback.get(normalized.host, ())
+        return normalized in self.exact
+
+    def __len__(self):
+        return len(self.exact) + sum(len(paths) for paths in self.loopback.values())
@@ -0,0 +1,217 @@
+import datetime
+import hashlib
+import logging
+import secrets
+import time
+import uuid
+from typing import NamedTuple
+from uuid import UUID
+
+from tortoise.transactions import in_transaction
+
+from ..models import RefreshTokens
+from ..utils.purge import PurgeJob
+from ..utils.scopes import scope_registry
+from ..utils.settings import get_settings
+from ..utils.timing_wheel import Timer, TimingWheel, expiry_wheel
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshGrant(NamedTuple):
+    token_hash: str
+    family_id: UUID
+    client_id: UUID
+    user_id: UUID | None
+    scope: str
+    expires_at: float  # unix time
+    used: bool = False
+
+
+def generate_refresh_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def scope_allowed(grant: RefreshGrant, scope: str | None) -> bool:
+    if scope is None:
+        return True
+    requested = scope_registry.parse(scope)
+    return requested is not None and scope_registry.contains(scope_registry.parse_known(grant.scope), requested)
+
+
+class RefreshTokenStore:
+    """Непрозрачные refresh-токены с ротацией: каждый токен погашается один раз и
+    заменяется новым из того же семейства. Повторное предъявление погашенного
+    токена означает утечку — отзывается всё семейство."""
+
+    needs_purge = True
+
+    def _new_grant(self, client_id: UUID, user_id: UUID | None, scope: str,
+                   family_id: UUID | None = None) -> tuple[str, RefreshGrant]:
+        token = generate_refresh_token()
+        return token, RefreshGrant(token_hash=hash_refresh_token(token),
+                                   family_id=family_id or uuid.uuid4(),
+                                   client_id=client_id,
+                                   user_id=user_id,
+                                   scope=scope,
+                                   expires_at=time.time() + get_settings().refresh_token_ttl_days * 86400)
+
+    async def issue(self, client_id: UUID, user_id: UUID | None, scope: str) -> str:
+        raise NotImplementedError
+
+    async def rotate(self, token: str, client_id: UUID, scope: str | None = None) -> tuple[RefreshGrant, str] | None:
+        """Возвращает погашенный грант и новый токен. None — токен неизвестен, истёк, выдан
+        другому клиенту, scope шире исходного или токен уже был погашен (тогда семейство отозвано)."""
+        raise NotImplementedError
+
+    async def revoke_family(self, family_id: UUID):
+        raise NotImplementedError
+
+    async def revoke(self, token: str, client_id: UUID) -> bool:
+        """Отзыв по RFC 7009: вместе с токеном отзывается всё его семейство."""
+        raise NotImplementedError
+
+    async def purge(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryRefreshTokenStore(RefreshTokenStore):
+    """Токены теряются при рестарте и не видны другим воркерам — для разработки и одного процесса."""
+
+    owner = "refresh_tokens"
+    needs_purge = False
+
+    def __init__(self, wheel: TimingWheel = expiry_wheel):
+        self._tokens: dict[str, tuple[RefreshGrant, Timer]] = {}
+        self._families: dict[UUID, set[str]] = {}
+        self._wheel = wheel
+        wheel.register(self.owner, self._expire)
+
+    def _expire(self, token_hashes: list[str]):
+        for token_hash in token_hashes:
+            if item := self._tokens.pop(token_hash, None):
+                self._discard_from_family(item[0])
+
+    def _discard_from_family(self, grant: RefreshGrant):
+        if (family := self._families.get(grant.family_id)) is not None:
+            family.discard(grant.token_hash)
+            if not family:
+                del self._families[grant.family_id]
+
+    def _save(self, grant: RefreshGrant):
+        self._tokens[grant.token_hash] = (grant, self._wheel.schedule(self.owner, grant.token_hash, grant.expires_at))
+        self._families.setdefault(grant.family_id, set()).add(grant.token_hash)
+
+    async def issue(self, client_id: UUID, user_id: UUID | None, scope: str) -> str:
+        token, grant = self._new_grant(client_id, user_id, scope)
+        self._save(grant)
+        return token
+
+    async def rotate(self, token: str, client_id: UUID, scope: str | None = None) -> tuple[RefreshGrant, str] | None:
+        # Без await внутри — проверка и погашение атомарны в рамках event loop
+        if not (item := self._tokens.get(hash_refresh_token(token))):
+            return None
+        grant, timer = item
+        if grant.used:
+            logger.warning("Refresh token reuse detected, revoking family %s", grant.family_id)
+            await self.revoke_family(grant.family_id)
+            return None
+        if grant.client_id != client_id or grant.expires_at <= time.time() or not scope_allowed(grant, scope):
+            return None
+
+        # Погашенный токен храним до истечения, чтобы распознать повторное предъявление
+        self._tokens[grant.token_hash] = (grant._replace(used=True), timer)
+        new_token, new_grant = self._new_grant(grant.client_id, grant.user_id, grant.scope, grant.family_id)
+        self._save(new_grant)
+        return grant, new_token
+
+    async def revoke(self, token: str, client_id: UUID) -> bool:
+        if not (item := self._tokens.get(hash_refresh_token(token))) or item[0].client_id != client_id:
+            return False
+        await self.revoke_family(item[0].family_id)
+        return True
+
+    async def revoke_family(self, family_id: UUID):
+        for token_hash in self._families.pop(family_id, ()):
+            if item := self._tokens.pop(token_hash, None):
+                self._wheel.cancel(item[1])
+
+    async def purge(self) -> int:
+        return 0
+
+
+def _to_datetime(timestamp: float) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+
+
+class PostgresRefreshTokenStore(RefreshTokenStore):
+    async def issue(self, client_id: UUID, user_id: UUID | None, scope: str) -> str:
+        token, grant = self._new_grant(client_id, user_id, scope)
+        async with in_transaction() as conn:
+            await self._save(grant, conn)
+        return token
+
+    @staticmethod
+    async def _save(grant: RefreshGrant, conn):
+        await RefreshTokens.create(token_hash=grant.token_hash,
+                                   family_id=grant.family_id,
+                                   client_id=grant.client_id,
+                                   user_id=grant.user_id,
+                                   scope=grant.scope,
+                                   expires_at=_to_datetime(grant.expires_at),
+                                   using_db=conn)
+
+    async def rotate(self, token: str, client_id: UUID, scope: str | None = None) -> tuple[RefreshGrant, str] | None:
+        async with in_transaction() as conn:
+            stored = await RefreshTokens.filter(token_hash=hash_refresh_token(token)).using_db(
+                    conn).select_for_update().first()
+            if not stored:
+                return None
+            if stored.used:
+                logger.warning("Refresh token reuse detected, revoking family %s", stored.family_id)
+                await RefreshTokens.filter(family_id=stored.family_id).using_db(conn).delete()
+                return None
+
+            grant = RefreshGrant(token_hash=stored.token_hash, family_id=stored.family_id,
+                                 client_id=stored.client_id, user_id=stored.user_id, scope=stored.scope,
+                                 expires_at=stored.expires_at.timestamp())
+            if grant.client_id != client_id or grant.expires_at <= time.time() or not scope_allowed(grant, scope):
+                return None
+
+            stored.used = True
+            await stored.save(update_fields=['used'], using_db=conn)
+            new_token, new_grant = self._new_grant(grant.client_id, grant.user_id, grant.scope, grant.family_id)
+            await self._save(new_grant, conn)
+        return grant, new_token
+
+    async def revoke(self, token: str, client_id: UUID) -> bool:
+        async with in_transaction() as conn:
+            if not (stored := await RefreshTokens.get_or_none(token_hash=hash_refresh_token(token), using_db=conn)):
+                return False
+            if stored.client_id != client_id:
+                return False
+            await RefreshTokens.filter(family_id=stored.family_id).using_db(conn).delete()
+        return True
+
+    async def revoke_family(self, family_id: UUID):
+        async with in_transaction() as conn:
+            await RefreshTokens.filter(family_id=family_id).using_db(conn).delete()
+
+    async def purge(self) -> int:
+        async with in_transaction() as conn:
+            return await RefreshTokens.filter(
+                    expires_at__lt=datetime.datetime.now(datetime.timezone.utc)).using_db(conn).delete()
+
+
+def create_refresh_token_store() -> RefreshTokenStore:
+    if get_settings().refresh_token_store == "memory":
+        return MemoryRefreshTokenStore()
+    return PostgresRefreshTokenStore()
+
+
+refresh_token_store = create_refresh_token_store()
+refresh_purge_job = PurgeJob(refresh_token_store, get_settings().refresh_token_purge_interval)
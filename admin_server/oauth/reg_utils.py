@@ -0,0 +1,72 @@
+from typing import NamedTuple
+from uuid import UUID
+
+import orjson
+from pydantic import AnyUrl
+from tortoise import Model
+
+from ..models import Clients, RedirectURIs, GrantTypes, ResponseTypes, Contacts, JWKs, ClientLocalizations
+from ..utils.i18n import localized_key, split_localized_key
+
+# Списочные поля запроса: таблица и колонка для одного элемента
+list_relations: dict[str, tuple[type[Model], str]] = {
+    'redirect_uris': (RedirectURIs, 'redirect_uri'),
+    'grant_types': (GrantTypes, 'grant_type'),
+    'response_types': (ResponseTypes, 'response_type'),
+    'contacts': (Contacts, 'contact'),
+    'jwks': (JWKs, 'jwk'),
+}
+
+client_columns = frozenset(Clients._meta.db_fields)
+
+
+def _db_value(value):
+    if isinstance(value, AnyUrl):
+        return str(value)
+    if isinstance(value, dict):
+        return orjson.dumps(value).decode()
+    return value
+
+
+class RegistrationPayload(NamedTuple):
+    client: dict
+    lists: dict[type[Model], list[Model]]
+
+
+def split_registration(client_id: UUID, data: dict) -> RegistrationPayload:
+    """Раскладывает заданные поля клиента (ключи по alias) по таблицам за один проход.
+    Пустые списки не попадают в payload, локализации — по строке на значение."""
+    client, lists, localized = {}, {}, []
+    for key, value in data.items():
+        if value is None:
+            continue
+        if key in client_columns:
+            client[key] = _db_value(value)
+        elif relation := list_relations.get(key):
+            model_cls, column = relation
+            if value:
+                lists[model_cls] = [model_cls(client_id=client_id, **{column: _db_value(item)}) for item in value]
+        elif localized_field := split_localized_key(key):
+            field, lang_tag = localized_field
+            localized.append(ClientLocalizations(client_id=client_id, field=field, lang_tag=lang_tag,
+                                                 value=_db_value(value)))
+    if localized:
+        lists[ClientLocalizations] = localized
+    return RegistrationPayload(client, lists)
+
+
+async def save_registration(payload: RegistrationPayload, conn):
+    # Одна строка Clients и по одному многострочному INSERT на каждую непустую связь
+    await Clients.create(**payload.client, using_db=conn)
+    for model_cls, rows in payload.lists.items():
+        await model_cls.bulk_create(rows, using_db=conn)
+
+
+async def load_localizations(client_ids, conn=None) -> dict[UUID, dict[str, str]]:
+    """Локализованные метаданные клиентов в формате ответа регистрации: {"client_name#ja-JP": ...}."""
+    result = {client_id: {} for client_id in client_ids}
+    rows = await ClientLocalizations.filter(client_id__in=list(result)).using_db(conn).values_list(
+            'client_id', 'field', 'lang_tag', 'value')
+    for client_id, field, lang_tag, value in rows:
+        result[client_id][localized_key(field, lang_tag)] = value
+    return result
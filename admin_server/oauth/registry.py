@@ -0,0 +1,107 @@
+import datetime
+import enum
+from typing import NamedTuple
+from uuid import UUID
+
+from tortoise.transactions import in_transaction
+
+from .redirects import RedirectMatcher
+from ..models import Clients, GrantTypesEnum, ResponseTypesEnum
+from ..utils.cache import LRUCache
+from ..utils.invalidation import invalidation_bus
+from ..utils.scopes import scope_registry
+from ..utils.settings import get_settings
+
+GrantTypeFlags = enum.Flag('GrantTypeFlags', [member.name for member in GrantTypesEnum])
+ResponseTypeFlags = enum.Flag('ResponseTypeFlags', [member.name for member in ResponseTypesEnum])
+
+
+def grant_type_flags(values) -> GrantTypeFlags:
+    flags = GrantTypeFlags(0)
+    for value in values:
+        flags |= GrantTypeFlags[GrantTypesEnum(value).name]
+    return flags
+
+
+def response_type_flags(values) -> ResponseTypeFlags:
+    flags = ResponseTypeFlags(0)
+    for value in values:
+        flags |= ResponseTypeFlags[ResponseTypesEnum(value).name]
+    return flags
+
+
+class ClientRecord(NamedTuple):
+    """Неизменяемый снимок клиента со всеми связанными данными, нужными authorize/token."""
+
+    client_id: UUID
+    secret_hash: str | None
+    secret_expires_at: datetime.datetime | None
+    token_endpoint_auth_method: str
+    redirect_uris: RedirectMatcher
+    grant_types: GrantTypeFlags
+    response_types: ResponseTypeFlags
+    scope: int  # маска из scope_registry
+
+    @classmethod
+    def from_model(cls, client: Clients) -> "ClientRecord":
+        return cls(client_id=client.client_id,
+                   secret_hash=client.client_secret,
+                   secret_expires_at=client.client_secret_expires_at,
+                   token_endpoint_auth_method=client.token_endpoint_auth_method.value,
+                   redirect_uris=RedirectMatcher.from_uris(uri.redirect_uri for uri in client.redirect_uris),
+                   grant_types=grant_type_flags(grant.grant_type for grant in client.grant_types),
+                   response_types=response_type_flags(resp.response_type for resp in client.response_types),
+                   scope=scope_registry.parse_known(client.scope))
+
+    def seconds_until_expiry(self) -> float | None:
+        if not (expires_at := self.secret_expires_at):
+            return None
+        return (expires_at - datetime.datetime.now(expires_at.tzinfo)).total_seconds()
+
+
+class ClientRegistry:
+    _related = ('redirect_uris', 'grant_types', 'response_types')
+
+    def __init__(self, maxsize: int, ttl: float):
+        # Статистика — в /metrics/caches через named_caches
+        self.cache = LRUCache(maxsize, ttl, name='clients')
+
+    def _remember(self, client: Clients) -> ClientRecord:
+        record = ClientRecord.from_model(client)
+        self.cache.set(record.client_id, record, record.seconds_until_expiry())
+        return record
+
+    async def get(self, client_id: UUID) -> ClientRecord | None:
+        if record := self.cache.get(client_id):
+            return record
+        async with in_transaction() as conn:
+            client = await Clients.filter(client_id=client_id).using_db(conn).prefetch_related(*self._related).first()
+        return self._remember(client) if client else None
+
+    async def get_many(self, client_ids) -> dict[UUID, ClientRecord]:
+        found, missing = {}, set()
+        for client_id in client_ids:
+            if record := self.cache.get(client_id):
+                found[client_id] = record
+            else:
+                missing.add(client_id)
+        if missing:
+            # Все промахи достаются одним запросом (плюс по одному на каждую связь)
+            async with in_transaction() as conn:
+                for client in await Clients.filter(client_id__in=missing).using_db(conn).prefetch_related(
+                        *self._related):
+                    found[client.client_id] = self._remember(client)
+        return found
+
+    def invalidate(self, client_id: UUID):
+        self.cache.pop(client_id)
+
+    def on_invalidation(self, key: str | None):
+        if key is None:
+            self.cache.clear()
+        else:
+            self.invalidate(UUID(key))
+
+
+client_registry = ClientRegistry(get_settings().client_cache_size, get_settings().client_cache_ttl)
+invalidation_bus.subscribe('clients', client_registry.on_invalidation)
@@ -1,28 +1,50 @@
 import base64
 import datetime
-import random
 from typing import Annotated
 from urllib import parse
 from uuid import uuid4
 
 from fastapi import APIRouter, Request, Header, Form, Response
 from fastapi.responses import HTMLResponse, RedirectResponse
+from jose import JWTError
 from pydantic import UUID4, EmailStr
 from tortoise.transactions import in_transaction
 
-from .exceptions import AccessDeniedError, InvalidScopeError, UnsupportedResponseTypeError, UnauthorizedClientError
+from .exceptions import (AccessDeniedError, InvalidScopeError, UnsupportedResponseTypeError, UnauthorizedClientError,
+                         TemporarilyUnavailable, BaseOauthError, RedirectURIMismatch)
 from .exceptions import (InvalidResponseTypesException, NoRedirectURIsException, SussySoftwareException,
                          NoInitialTokenException, PublicClientNotAllowedException, InvalidSoftwareStatement,
                          MultipleGrantTypesNotAllowedException, InvalidMetadataURI, TokenInvalidRequest,
-                         TokenAccessDenied)
+                         TokenInvalidClient, TokenInvalidScope, TokenUnauthorizedClient,
+                         TokenInvalidGrant, TokenUnsupportedGrantType)
+from .clients import authenticate_client, authenticate_clients
+from .codes import code_store
+from .introspection import introspect, introspection_latency
+from .redirects import normalize_redirect_uri
+from .refresh import refresh_token_store
+from .reg_utils import split_registration, save_registration
+from .registry import ClientRecord, GrantTypeFlags, client_registry, response_type_flags
 from .schemas import types_mapping
+from ..exceptions import PasswordHasherOverloadedError
 from ..models import Creds, Clients
-from ..schemas import ClientRegistrationRequest, ClientInformationResponse, HttpsUrl, GrantTypes
-from ..utils.security import verify_password, oauth_scopes, Policies, get_password_hash, create_jwt
-from ..utils.templating import templates
+from ..schemas import (ClientRegistrationRequest, ClientInformationResponse, RedirectUri, GrantTypes,
+                       BatchTokenRequest)
+from ..utils.cache import cached_response
+from ..utils.invalidation import invalidation_bus
+from ..utils.revocation import revocation_list
+from ..utils.scopes import scope_registry
+from ..utils.security import (verify_password, Policies, create_jwt, create_jwt_many, decode_jwt,
+                              get_jwt_lifetime, generate_client_secret, hash_client_secret)
+from ..utils.settings import get_settings
+from ..utils.templating import PageCache, templates
 
 router = APIRouter(prefix='/oauth')
 
+# Что реально обрабатывает /oauth/token — отсюда строятся метаданные сервера
+supported_response_types = ("code",)
+supported_grant_types = ("authorization_code", "client_credentials", "refresh_token")
+token_endpoint_auth_methods = ("client_secret_basic", "none")
+
 
 @router.get('/authorize')
 async def login_page(request: Request):
@@ -33,11 +55,20 @@ async def try_to_auth():
     pass
 
 
-async def validate_client(client: Clients,
+async def validate_client(client: ClientRecord,
                           scope: str,
                           response_type: str,
-                          redirect_uri: HttpsUrl):
-    pass
+                          redirect_uri: RedirectUri,
+                          state: str | None = None) -> int:
+    """Возвращает маску запрошенного scope, если клиенту можно его выдать."""
+    if not response_type_flags([response_type]) & client.response_types:
+        raise UnauthorizedClientError(redirect_uri, state)
+    if GrantTypeFlags.AUTHORIZATION_CODE not in client.grant_types:
+        raise UnauthorizedClientError(redirect_uri, state)
+    # Только подмножество scope, зарегистрированного для клиента
+    if not (scope_mask := scope_registry.parse(scope)) or not scope_registry.contains(client.scope, scope_mask):
+        raise InvalidScopeError(redirect_uri, state)
+    return scope_mask
 
 
 @router.post('/authorize')
@@ -46,81 +77,267 @@ async def try_to_auth_router(login: Annotated[EmailStr, Form()],
                              scope: str,
                              response_type: str,
                              client_id: UUID4,
-                             redirect_uri: HttpsUrl,
+                             redirect_uri: RedirectUri,
                              state: str | None = None,
                              nonce: str | None = None):
-    if response_type != "code":
+    # Пока redirect_uri не сверен с зарегистрированными, ошибки отдаём без перенаправления
+    if not (client := await client_registry.get(client_id)) or not client.redirect_uris.matches(str(redirect_uri)):
+        raise RedirectURIMismatch()
+
+    if response_type not in supported_response_types:
         raise UnsupportedResponseTypeError(redirect_uri, state)
+    scope_mask = await validate_client(client, scope, response_type, redirect_uri, state)
 
     async with in_transaction() as conn:
-        if not (client := await Clients.get_or_none(id=client_id)):
-            raise UnauthorizedClientError(redirect_uri, state)
-        await validate_client(client, scope, response_type, redirect_uri)
-
-        scopes = set(scope.split(sep=' '))
-        if len(scopes) != len(scopes & set(oauth_scopes)):
-            raise InvalidScopeError(redirect_uri, state)
-
         if not (creds_in_db := await Creds.get_or_none(login=login, using_db=conn)):
             raise AccessDeniedError(redirect_uri=redirect_uri, state=state)
-        if not verify_password(passwd, creds_in_db.passwd):
-            raise AccessDeniedError(redirect_uri=redirect_uri, state=state)
 
-        query = {'code': base64.b64encode(f'{random.getrandbits(32)}'.encode()).decode('ascii')}
-        if state:
-            query['state'] = state
-        return RedirectResponse(f"{redirect_uri}?{parse.urlencode(query)}",
-                                status_code=302)
-
-
-async def exchange_client_creds_on_token(client_id: str, secret: str, scope: str):
-    async with in_transaction() as conn:
-        if client := await Clients.get_or_none(client_id=client_id, client_secret=get_password_hash(secret),
-                                               using_db=conn):
-            await create_jwt(
-                    {'client_id': client_id,
-                     'scope': scope
-                     }
-            )
-        raise TokenAccessDenied()
-
-
-async def exchange_code_for_token(code, redirect_uri, client_id):
-    pass
+    # bcrypt проверяем вне транзакции, чтобы не держать соединение с БД
+    try:
+        if not await verify_password(passwd, creds_in_db.passwd):
+            raise AccessDeniedError(redirect_uri=redirect_uri, state=state)
+    except PasswordHasherOverloadedError:
+        raise TemporarilyUnavailable(redirect_uri=redirect_uri, state=state)
+
+    # В коде храним нормализованный URI — с ним же сверяется redirect_uri на /token
+    code = await code_store.issue(client.client_id, creds_in_db.user_id,
+                                  str(normalize_redirect_uri(str(redirect_uri))),
+                                  scope_registry.to_string(scope_mask), nonce)
+    query = {'code': code}
+    if state:
+        query['state'] = state
+    return RedirectResponse(f"{redirect_uri}?{parse.urlencode(query)}",
+                            status_code=302)
+
+
+def access_token_response(token: str, lifetime: datetime.timedelta, scope: str,
+                          refresh_token: str | None = None) -> dict:
+    response = {'access_token': token,
+                'token_type': 'Bearer',
+                'expires_in': int(lifetime.total_seconds()),
+                'scope': scope}
+    if refresh_token:
+        response['refresh_token'] = refresh_token
+    return response
+
+
+def resolve_client_scope(client: ClientRecord, scope: str | None) -> str | None:
+    requested = scope_registry.parse(scope) if scope is not None else client.scope
+    if requested is None or not scope_registry.contains(client.scope, requested):
+        return None
+    return scope_registry.to_string(requested)
+
+
+async def exchange_client_creds_on_token(client_id: str, secret: str, scope: str | None):
+    if not (client := await authenticate_client(client_id, secret)):
+        raise TokenInvalidClient()
+    if GrantTypeFlags.CLIENT_CREDENTIALS not in client.grant_types:
+        raise TokenUnauthorizedClient()
+    if (granted_scope := resolve_client_scope(client, scope)) is None:
+        raise TokenInvalidScope()
+    lifetime = get_jwt_lifetime()
+    token = await create_jwt({'client_id': str(client.client_id), 'scope': granted_scope}, lifetime)
+    return access_token_response(token, lifetime, granted_scope)
+
+
+def parse_basic_auth(authorization: str) -> tuple[str, str]:
+    try:
+        scheme, base64string = authorization.split()
+        client_id, client_secret = base64.b64decode(base64string).decode('utf-8').split(':', 1)
+    except ValueError:
+        raise TokenInvalidClient()
+    if scheme.lower() != 'basic':
+        raise TokenInvalidClient()
+    return client_id, client_secret
+
+
+async def authenticate_token_client(authorization: str | None, client_id: UUID4 | None) -> ClientRecord:
+    if authorization:
+        basic_client_id, client_secret = parse_basic_auth(authorization)
+        if not (client := await authenticate_client(basic_client_id, client_secret)):
+            raise TokenInvalidClient()
+        if client_id and client_id != client.client_id:
+            raise TokenInvalidClient()
+        return client
+    # Без заголовка допускаются только публичные клиенты, client_id берём из формы
+    if not client_id or not (client := await client_registry.get(client_id)):
+        raise TokenInvalidClient()
+    if client.token_endpoint_auth_method != "none":
+        raise TokenInvalidClient()
+    return client
+
+
+async def exchange_code_for_token(client: ClientRecord, code: str, redirect_uri: str):
+    if GrantTypeFlags.AUTHORIZATION_CODE not in client.grant_types:
+        raise TokenUnauthorizedClient()
+    if not (grant := await code_store.redeem(code, client.client_id, redirect_uri)):
+        raise TokenInvalidGrant()
+    lifetime = get_jwt_lifetime()
+    claims = {'sub': str(grant.user_id), 'client_id': str(client.client_id), 'scope': grant.scope}
+    if grant.nonce:
+        claims['nonce'] = grant.nonce
+    token = await create_jwt(claims, lifetime)
+    refresh_token = None
+    if GrantTypeFlags.REFRESH_TOKEN in client.grant_types:
+        refresh_token = await refresh_token_store.issue(client.client_id, grant.user_id, grant.scope)
+    return access_token_response(token, lifetime, grant.scope, refresh_token)
+
+
+# Продление — одно чтение по хешу токена и одна подпись, без проверки пароля
+async def exchange_refresh_token(client: ClientRecord, refresh_token: str, scope: str | None):
+    if GrantTypeFlags.REFRESH_TOKEN not in client.grant_types:
+        raise TokenUnauthorizedClient()
+    requested_scope = None
+    if scope is not None and (requested_scope := resolve_client_scope(client, scope)) is None:
+        raise TokenInvalidScope()
+    if not (rotated := await refresh_token_store.rotate(refresh_token, client.client_id, scope)):
+        raise TokenInvalidGrant()
+    grant, new_refresh_token = rotated
+
+    granted_scope = requested_scope or grant.scope
+    lifetime = get_jwt_lifetime()
+    claims = {'client_id': str(client.client_id), 'scope': granted_scope}
+    if grant.user_id:
+        claims['sub'] = str(grant.user_id)
+    token = await create_jwt(claims, lifetime)
+    return access_token_response(token, lifetime, granted_scope, new_refresh_token)
 
 
 @router.post('/token')
 async def get_token(response: Response, request: Request,
                     grant_type: Annotated[GrantTypes, Form()],
                     code: Annotated[str, Form()] = None,
+                    refresh_token: Annotated[str, Form()] = None,
                     scope: Annotated[str, Form()] = None,
-                    redirect_uri: Annotated[HttpsUrl, Form()] = None,
+                    redirect_uri: Annotated[RedirectUri, Form()] = None,
                     client_id: Annotated[UUID4, Form()] = None,
                     authorization: Annotated[str, Header()] = None):
     response.headers.append('Cache-Control', 'no-store')
     response.headers.append('Pragma', 'no-cache')
 
-    if not authorization:
-        raise TokenAccessDenied()
-
     match grant_type:
         case "client_credentials":
-            base64string = authorization.split()[1]
-            try:
-                client_id, client_secret = base64.b64decode(base64string).decode('utf-8').split(':')[:2]
-                return await exchange_client_creds_on_token(client_id, client_secret, scope)
-            except ValueError:
-                raise TokenAccessDenied()
+            # Только конфиденциальные клиенты, аутентификация как на /introspect и /revoke
+            if not authorization:
+                raise TokenInvalidClient()
+            return await exchange_client_creds_on_token(*parse_basic_auth(authorization), scope)
 
         case "authorization_code":
-            if not code or scope:
+            if not code or not redirect_uri or scope:
                 raise TokenInvalidRequest()
-            return exchange_code_for_token(client_id, code, redirect_uri)
+            client = await authenticate_token_client(authorization, client_id)
+            redirect_uri = normalize_redirect_uri(str(redirect_uri))
+            return await exchange_code_for_token(client, code, str(redirect_uri))
+
+        case "refresh_token":
+            if not refresh_token:
+                raise TokenInvalidRequest()
+            client = await authenticate_token_client(authorization, client_id)
+            return await exchange_refresh_token(client, refresh_token, scope)
+
+        case _:
+            raise TokenUnsupportedGrantType()
+
+
+@router.post('/introspect')
+async def introspect_token(response: Response,
+                           token: Annotated[str, Form()],
+                           token_type_hint: Annotated[str, Form()] = None,
+                           authorization: Annotated[str, Header()] = None):
+    response.headers.append('Cache-Control', 'no-store')
+    response.headers.append('Pragma', 'no-cache')
+
+    # RFC 7662: вызывающий обязан аутентифицироваться, публичным клиентам отказываем
+    if not authorization:
+        raise TokenInvalidClient()
+    if not await authenticate_client(*parse_basic_auth(authorization)):
+        raise TokenInvalidClient()
+
+    # Refresh-токены непрозрачны и не интроспектируются, token_type_hint только подсказка
+    with introspection_latency.time():
+        return await introspect(token)
+
+
+async def revoke_access_token(client: ClientRecord, token: str) -> bool:
+    try:
+        claims = await decode_jwt(token)
+    except JWTError:
+        # Истёкший, чужой или уже отозванный токен отзывать не нужно
+        return False
+    if claims.get('client_id') != str(client.client_id) or not (jti := claims.get('jti')):
+        return False
+    await revocation_list.revoke(jti, claims['exp'])
+    return True
+
+
+@router.post('/revoke')
+async def revoke_token(response: Response,
+                       token: Annotated[str, Form()],
+                       token_type_hint: Annotated[str, Form()] = None,
+                       client_id: Annotated[UUID4, Form()] = None,
+                       authorization: Annotated[str, Header()] = None):
+    response.headers.append('Cache-Control', 'no-store')
+    response.headers.append('Pragma', 'no-cache')
+
+    client = await authenticate_token_client(authorization, client_id)
+    # RFC 7009: на неизвестный или чужой токен тоже отвечаем 200
+    if token_type_hint == 'refresh_token':
+        if not await refresh_token_store.revoke(token, client.client_id):
+            await revoke_access_token(client, token)
+    else:
+        if not await revoke_access_token(client, token):
+            await refresh_token_store.revoke(token, client.client_id)
+    return {}
+
+
+def batch_token_error(client_id: UUID4, error: type[BaseOauthError]) -> dict:
+    return {'client_id': client_id, 'error': error.error, 'description': error.description}
+
+
+@router.post('/token/batch')
+async def get_tokens_batch(response: Response, batch: BatchTokenRequest):
+    response.headers.append('Cache-Control', 'no-store')
+    response.headers.append('Pragma', 'no-cache')
+
+    if len(batch.items) > get_settings().token_batch_max_size:
+        raise TokenInvalidRequest()
+
+    clients = await authenticate_clients([(item.client_id, item.client_secret) for item in batch.items])
+
+    results: list[dict | None] = [None] * len(batch.items)
+    to_sign, positions = [], []
+    for position, (item, client) in enumerate(zip(batch.items, clients)):
+        if not client:
+            results[position] = batch_token_error(item.client_id, TokenInvalidClient)
+            continue
+        if GrantTypeFlags.CLIENT_CREDENTIALS not in client.grant_types:
+            results[position] = batch_token_error(item.client_id, TokenUnauthorizedClient)
+            continue
+        if (granted_scope := resolve_client_scope(client, item.scope)) is None:
+            results[position] = batch_token_error(item.client_id, TokenInvalidScope)
+            continue
+        to_sign.append({'client_id': str(item.client_id), 'scope': granted_scope})
+        positions.append(position)
+
+    lifetime = get_jwt_lifetime()
+    tokens = await create_jwt_many(to_sign, lifetime)
+    for position, claims, token in zip(positions, to_sign, tokens):
+        results[position] = {'client_id': batch.items[position].client_id,
+                             **access_token_response(token, lifetime, claims['scope'])}
+    return {'tokens': results}
 
 
 @router.post('/refresh_token')
-async def get_refresh_token():
-    pass
+async def get_refresh_token(response: Response,
+                            refresh_token: Annotated[str, Form()],
+                            scope: Annotated[str, Form()] = None,
+                            client_id: Annotated[UUID4, Form()] = None,
+                            authorization: Annotated[str, Header()] = None):
+    response.headers.append('Cache-Control', 'no-store')
+    response.headers.append('Pragma', 'no-cache')
+
+    client = await authenticate_token_client(authorization, client_id)
+    return await exchange_refresh_token(client, refresh_token, scope)
 
 
 async def process_registration(registration_request: ClientRegistrationRequest,
@@ -131,7 +348,7 @@ async def process_registration(registration_request: ClientRegistrationRequest,
                                trust_content: bool = True,
                                override_on_diff: bool = True,
                                allow_multi_instance_clients: bool = True,
-                               client_secret_len: int = 128,
+                               client_secret_len: int = 256,
                                client_secret_exp_days: int = 30):
     if not allow_public_clients_policy and registration_request.token_endpoint_auth_method == "none":
         raise PublicClientNotAllowedException
@@ -149,54 +366,43 @@ async def process_registration(registration_request: ClientRegistrationRequest,
                                                 "implicit"} and not registration_request.redirect_uris:
         raise NoRedirectURIsException
 
-    sites = {f'{uri.scheme}://{uri.host}' for uri in registration_request.redirect_uris}
+    # Запрос сериализуется один раз: из этого словаря строятся и строки таблиц, и ответ
+    client_data = registration_request.model_dump(by_alias=True, exclude_unset=True)
+
+    sites = {f'{uri.scheme}://{uri.host}' for uri in registration_request.redirect_uris or ()}
     if strict_uris:
-        properties = {f'{v.scheme}://{v.host}' for k, v in registration_request.model_dump().items() if
+        properties = {f'{v.scheme}://{v.host}' for k, v in client_data.items() if
                       'uri' in k and v and k != 'redirect_uris'}
         if len(properties | sites) != len(sites):
             raise InvalidMetadataURI
 
-
     if not allow_multi_instance_clients:
         if not registration_request.software_id and not registration_request.software_version:
             raise SussySoftwareException
 
-    response_model = ClientInformationResponse(client_id=uuid4(),
-                                               client_id_issued_at=datetime.datetime.now(),
-                                               **registration_request.model_dump(exclude_unset=True))
+    client_data['client_id'] = client_id = uuid4()
+    client_data['client_id_issued_at'] = datetime.datetime.now()
+    client_secret = None
     if registration_request.token_endpoint_auth_method != "none":
-        response_model.client_secret = get_password_hash(
-                base64.b64encode(f'{random.getrandbits(client_secret_len)}'.encode()).decode(
-                        'ascii'))
-        response_model.client_secret_expires_at = datetime.datetime.now() + datetime.timedelta(
+        client_secret = generate_client_secret(client_secret_len // 8)
+        client_data['client_secret'] = hash_client_secret(client_secret)
+        client_data['client_secret_expires_at'] = datetime.datetime.now() + datetime.timedelta(
                 days=client_secret_exp_days)
+    payload = split_registration(client_id, client_data)
 
     async with in_transaction() as conn:
         if not allow_multi_instance_clients and await Clients.exists(software_id=registration_request.software_id,
                                                                      software_version=registration_request.software_version,
                                                                      using_db=conn):
             raise SussySoftwareException
-        model_json = response_model.model_dump(by_alias=True, exclude_unset=True)
-
-        client_main = {k: v for k, v in model_json.items() if '#' not in k}
-        for k in ['client_name', 'tos_uri', 'policy_uri', 'logo_uri', 'client_uri', 'redirect_uris', 'grant_types',
-                  'response_types', 'contacts', 'jwks']:
-            client_main.pop(k, None)
-
-        new_client = await Clients.create(**client_main, using_db=conn)
-        for key in ['redirect_uris', 'grant_types', 'response_types', 'contacts', 'jwks']:
-            if key in model_json:
-                model_cls = getattr(new_client, key).remote_model
-                models = [model_cls(client_id=new_client.client_id, **{key[:-1]: i})
-                          for i in model_json[key]]
-                await model_cls.bulk_create(models, using_db=conn)
+        await save_registration(payload, conn)
 
-        for key in ['client_name', 'tos_uri', 'policy_uri', 'logo_uri', 'client_uri']:
-            model_dict = {k: v for k, v in model_json.items() if key in k}
-            await getattr(new_client, key + 's').remote_model.create(**model_dict, client_id=new_client.client_id,
-                                                                     using_db=conn)
+    await invalidation_bus.publish('clients', str(client_id))
 
-    return response_model.model_dump(by_alias=True, exclude_unset=True)
+    # В БД хранится только HMAC секрета, клиенту отдаём сам секрет
+    if client_secret:
+        client_data['client_secret'] = client_secret
+    return client_data
 
 
 @router.post('/register',
@@ -211,9 +417,20 @@ async def register_client(response: Response,
     return await process_registration(registration_request)
 
 
+def registration_form_context() -> dict:
+    schema = ClientRegistrationRequest.model_json_schema(by_alias=True)
+    # Локализованные свойства форма не показывает
+    return {'properties': {key: value for key, value in schema['properties'].items() if '#' not in key},
+            'req': schema['required']}
+
+
+registration_form = PageCache("client_reg.html", registration_form_context, name='registration_form')
+
+
 @router.get('/register',
             response_class=HTMLResponse)
-async def get_client_register_form(request: Request):
-    schema = ClientRegistrationRequest.model_json_schema(by_alias=True)
-    return templates.TemplateResponse(request, name="client_reg.html", context={'properties': schema['properties'],
-                                                                                'req': schema['required']})
+async def get_client_register_form(request: Request,
+                                   if_none_match: Annotated[str | None, Header()] = None):
+    body, etag = registration_form.get(request)
+    return cached_response(body, etag, get_settings().registration_form_max_age, if_none_match,
+                           media_type='text/html')
@@ -8,6 +8,7 @@ from ..dependencies import Pagination
 from ..exceptions import UserExistsError, UserDoesNotExistError
 from ..models import Users, Creds
 from ..schemas import UserRegister, UserOut, UserIn
+from ..utils.invalidation import invalidation_bus
 from ..utils.security import get_password_hash
 
 router = APIRouter(prefix='/users')
@@ -15,11 +16,13 @@ router = APIRouter(prefix='/users')
 
 @router.post('/', response_model=UserOut)
 async def register_user(response: Response, creds: UserRegister):
+    passwd_hash = await get_password_hash(creds.passwd)
     async with in_transaction() as conn:
         if user_id_db := await Creds.get_or_none(login=creds.login, using_db=conn):
             raise UserExistsError(user_id_db.user_id)
         user = await Users.create(using_db=conn)
-        await Creds.create(user=user, login=creds.login, passwd=get_password_hash(creds.passwd))
+        await Creds.create(user=user, login=creds.login, passwd=passwd_hash, using_db=conn)
+    await invalidation_bus.publish('users', str(user.id))
     response.status_code = 201
     return user
 
@@ -49,6 +52,7 @@ async def get_user(response: Response, user_id: Annotated[UUID4, Path()]):
     async with in_transaction() as conn:
         if user_in_db := await Users.get_or_none(id=user_id, using_db=conn):
             await user_in_db.delete(using_db=conn)
+            await invalidation_bus.publish('users', str(user_id), using_db=conn)
             response.status_code = 204
             return {'status': 'deleted'}
         raise UserDoesNotExistError(user_id)
@@ -60,6 +64,7 @@ async def edit_user(response: Response, user_id: Annotated[UUID4, Path()], edit_
         if user_in_db := await Users.get_or_none(id=user_id, using_db=conn):
             await user_in_db.update_from_dict(edit_data.model_dump())
             await user_in_db.save(using_db=conn)
+            await invalidation_bus.publish('users', str(user_id), using_db=conn)
             response.status_code = 202
             return await user_in_db.get(id=user_id, using_db=conn)
         raise UserDoesNotExistError(user_id)
@@ -0,0 +1,99 @@
+import base64
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+from fastapi import Response
+
+
+class LRUCache:
+    """LRU с ограничением по размеру и TTL записей (время — time.monotonic)."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None, name: str | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        if name:
+            named_caches[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        if (item := self._data.get(key)) is None:
+            self.misses += 1
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl or ttl)
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        if (item := self._data.pop(key, None)) is None:
+            return default
+        self.invalidations += 1
+        return item[1]
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key: Hashable):
+        return self.get(key, _missing) is not _missing
+
+
+_missing = object()
+
+# Кэши с именем попадают сюда и отдаются в /metrics/caches
+named_caches: dict[str, LRUCache] = {}
+
+
+def strong_etag(body: bytes) -> str:
+    """Сильный ETag для заранее сериализованного ответа."""
+    return '"' + base64.urlsafe_b64encode(hashlib.sha256(body).digest()[:16]).rstrip(b"=").decode() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix('W/') for candidate in if_none_match.split(',')}
+    return '*' in candidates or etag in candidates
+
+
+def cached_response(body: bytes, etag: str, max_age: int, if_none_match: str | None,
+                    media_type: str = 'application/json') -> Response:
+    headers = {'ETag': etag, 'Cache-Control': f'public, max-age={max_age}'}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
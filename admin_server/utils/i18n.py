@@ -1,3 +1,7 @@
+from functools import cache
+
+from .settings import get_settings
+
 lang_tags = {
     'af-ZA': 'Afrikaans (South Africa)',
     'ar-AE': 'Arabic (U.A.E.)',
@@ -154,16 +158,39 @@ lang_tags = {
     'zu-ZA': 'Zulu (South Africa)'
 }
 
-fields = {
+# Локализуемые метаданные клиента (RFC 7591, 2.2) и их подписи в форме регистрации
+localized_fields = {
     'client_name': 'Client name',
     'tos_uri': 'ToS URI',
     'policy_uri': 'Policy URI',
     'logo_uri': 'Logo URI',
     'client_uri': 'Client URI'
 }
-if __name__ == "__main__":
-    for field_name, field_title in fields.items():
-        print(f'class {''.join(v.capitalize() for v in field_name.split('_'))}Langs(BaseModel):')
-        for key, val in lang_tags.items():
-            print(f'    {field_name}_{key.lower().replace('-', '_')}: {'HttpsUrl' if 'URI' in field_title else 'str'} | None = Field(alias="{field_name}#{key}", '
-                  f'title="{field_title} ({val})", default=None, placeholder={'"https://sub.example.com"' if 'URI' in field_title else '"' + field_title + ' (' + val + ')"'})')
\ No newline at end of file
+
+
+def localized_key(field: str, lang_tag: str) -> str:
+    """Ключ в запросе/ответе регистрации: "client_name#ja-JP" или просто "client_name"."""
+    return f"{field}#{lang_tag}" if lang_tag else field
+
+
+@cache
+def enabled_lang_tags() -> dict[str, str]:
+    """Теги из настройки lang_tags (все известные, если она не задана). Поля и ключи
+    локализаций строятся только для них и только при первом обращении."""
+    if (allowed := get_settings().lang_tags) is None:
+        return lang_tags
+    if unknown := set(allowed) - lang_tags.keys():
+        raise ValueError(f"Unknown language tags in settings: {', '.join(sorted(unknown))}")
+    return {lang_tag: lang_tags[lang_tag] for lang_tag in allowed}
+
+
+@cache
+def localized_keys() -> dict[str, tuple[str, str]]:
+    """Все допустимые ключи, включая значения без языка: "client_name#ja-JP" -> ("client_name", "ja-JP")."""
+    return {localized_key(field, lang_tag): (field, lang_tag)
+            for field in localized_fields for lang_tag in ("", *enabled_lang_tags())}
+
+
+def split_localized_key(key: str) -> tuple[str, str] | None:
+    """("client_name", "ja-JP") для "client_name#ja-JP"; None, если ключ не локализуемый или язык выключен."""
+    return localized_keys().get(key)
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Callable
+
+import asyncpg
+import orjson
+from tortoise import connections
+
+from .settings import get_settings, TORTOISE_ORM
+
+logger = logging.getLogger(__name__)
+
+# Подписчик получает ключ изменённой записи или None — "сбросить всё"
+Subscriber = Callable[[str | None], None]
+
+
+class InvalidationBus:
+    def __init__(self):
+        self._subscribers: dict[str, list[Subscriber]] = defaultdict(list)
+
+    def subscribe(self, topic: str, subscriber: Subscriber):
+        self._subscribers[topic].append(subscriber)
+
+    def _deliver(self, topic: str, key: str | None):
+        for subscriber in self._subscribers.get(topic, ()):
+            try:
+                subscriber(key)
+            except Exception:
+                logger.exception("Invalidation subscriber failed for %s:%s", topic, key)
+
+    def _flush_all(self):
+        for topic in self._subscribers:
+            self._deliver(topic, None)
+
+    async def publish(self, topic: str, key: str | None, using_db=None):
+        self._deliver(topic, key)
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+
+class LocalInvalidationBus(InvalidationBus):
+    """Только внутри процесса: для тестов и запуска в один воркер."""
+
+
+class PostgresInvalidationBus(InvalidationBus):
+    """События между воркерами через LISTEN/NOTIFY. Свои изменения применяются сразу
+    и ещё раз, когда придёт собственное уведомление: внутри транзакции оно доставляется
+    только после COMMIT, а до него конкурентный запрос этого же воркера мог снова
+    закэшировать старую строку."""
+
+    channel = "admin_server_invalidation"
+
+    def __init__(self, credentials: dict, reconnect_delay: float = 1.0):
+        super().__init__()
+        self.credentials = credentials
+        self.reconnect_delay = reconnect_delay
+        self._conn: asyncpg.Connection | None = None
+        self._reconnect_task: asyncio.Task | None = None
+        self._stopping = False
+
+    async def _connect(self):
+        self._conn = await asyncpg.connect(**self.credentials)
+        self._conn.add_termination_listener(self._on_termination)
+        await self._conn.add_listener(self.channel, self._on_notify)
+
+    def _on_notify(self, connection, pid, channel, payload: str):
+        try:
+            event = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning("Malformed invalidation event: %r", payload)
+            return
+        self._deliver(event["t"], event.get("k"))
+
+    def _on_termination(self, connection):
+        if self._stopping:
+            return
+        # Пока слушателя нет, события теряются: после переподключения сбрасываем кэши целиком
+        logger.warning("Invalidation listener connection lost, reconnecting")
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self):
+        while not self._stopping:
+            try:
+                await self._connect()
+            except (OSError, asyncpg.PostgresError):
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+            self._flush_all()
+            return
+
+    async def publish(self, topic: str, key: str | None, using_db=None):
+        # Внутри транзакции (using_db) Postgres доставит уведомление только после COMMIT —
+        # в том числе этому воркеру, что и сбросит закэшированное до коммита
+        self._deliver(topic, key)
+        payload = orjson.dumps({"t": topic, "k": key}).decode()
+        await (using_db or connections.get("default")).execute_query("SELECT pg_notify($1, $2)",
+                                                                     [self.channel, payload])
+
+    async def start(self):
+        self._stopping = False
+        await self._connect()
+
+    async def stop(self):
+        self._stopping = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+        if self._conn and not self._conn.is_closed():
+            await self._conn.close()
+
+
+def create_invalidation_bus() -> InvalidationBus:
+    if get_settings().invalidation_backend == "postgres":
+        return PostgresInvalidationBus(TORTOISE_ORM["connections"]["default"]["credentials"])
+    return LocalInvalidationBus()
+
+
+invalidation_bus = create_invalidation_bus()
@@ -0,0 +1,180 @@
+import base64
+import binascii
+import calendar
+import json
+import time
+from datetime import datetime
+from typing import Callable
+
+import orjson
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature, encode_dss_signature
+from jose import jwt, JWTError, ExpiredSignatureError
+
+from .keys import KeyMaterial
+
+KeyLookup = Callable[[str | None], KeyMaterial | None]
+
+_time_claims = ("exp", "iat", "nbf")
+
+_hash_algs = {
+    "256": hashes.SHA256,
+    "384": hashes.SHA384,
+    "512": hashes.SHA512,
+}
+
+
+def b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+class JWSBackend:
+    name: str
+
+    def sign(self, claims: dict, key: KeyMaterial) -> str:
+        raise NotImplementedError
+
+    def decode(self, token: str, key_lookup: KeyLookup) -> dict:
+        raise NotImplementedError
+
+    def sign_many(self, claims_list: list[dict], key: KeyMaterial) -> list[str]:
+        return [self.sign(claims, key) for claims in claims_list]
+
+
+class JoseBackend(JWSBackend):
+    name = "jose"
+
+    def sign(self, claims: dict, key: KeyMaterial) -> str:
+        if key.signing_key is None:
+            raise JWTError(f"Algorithm {key.alg} is not supported by python-jose")
+        return jwt.encode(claims, key.signing_key, algorithm=key.alg, headers={"kid": key.kid})
+
+    def decode(self, token: str, key_lookup: KeyLookup) -> dict:
+        if not (key := key_lookup(jwt.get_unverified_header(token).get("kid"))):
+            raise JWTError("Unknown key id")
+        if key.verifying_key is None:
+            raise JWTError(f"Algorithm {key.alg} is not supported by python-jose")
+        return jwt.decode(token, key.verifying_key, algorithms=key.alg)
+
+
+class CryptographyBackend(JWSBackend):
+    """Подпись напрямую через cryptography (RS*, ES*, EdDSA): заголовок кодируется
+    один раз на ключ, полезная нагрузка сериализуется orjson. Для ASCII-claims
+    токены побайтно совпадают с python-jose (у RS* подпись детерминирована)."""
+
+    name = "cryptography"
+
+    def __init__(self):
+        self._headers: dict[tuple[str, str], bytes] = {}
+
+    def _encoded_header(self, key: KeyMaterial) -> bytes:
+        if (header := self._headers.get((key.kid, key.alg))) is None:
+            # Тот же формат, что у jose.jws._encode_header
+            header = b64url_encode(json.dumps({"alg": key.alg, "kid": key.kid, "typ": "JWT"},
+                                              separators=(",", ":"), sort_keys=True).encode("utf-8"))
+            self._headers[(key.kid, key.alg)] = header
+        return header
+
+    @staticmethod
+    def _sign_bytes(signing_input: bytes, key: KeyMaterial) -> bytes:
+        match key.alg[:2], key.alg[2:]:
+            case "RS", bits:
+                return key.private_key.sign(signing_input, padding.PKCS1v15(), _hash_algs[bits]())
+            case "ES", bits:
+                r, s = decode_dss_signature(key.private_key.sign(signing_input, ec.ECDSA(_hash_algs[bits]())))
+                size = (key.private_key.curve.key_size + 7) // 8
+                return r.to_bytes(size, "big") + s.to_bytes(size, "big")
+            case "Ed", "DSA":
+                return key.private_key.sign(signing_input)
+        raise JWTError(f"Algorithm {key.alg} is not supported")
+
+    @staticmethod
+    def _verify_bytes(signing_input: bytes, signature: bytes, key: KeyMaterial) -> bool:
+        try:
+            match key.alg[:2], key.alg[2:]:
+                case "RS", bits:
+                    key.public_key.verify(signature, signing_input, padding.PKCS1v15(), _hash_algs[bits]())
+                case "ES", bits:
+                    size = (key.public_key.curve.key_size + 7) // 8
+                    if len(signature) != 2 * size:
+                        return False
+                    der = encode_dss_signature(int.from_bytes(signature[:size], "big"),
+                                               int.from_bytes(signature[size:], "big"))
+                    key.public_key.verify(der, signing_input, ec.ECDSA(_hash_algs[bits]()))
+                case "Ed", "DSA":
+                    key.public_key.verify(signature, signing_input)
+                case _:
+                    return False
+        except InvalidSignature:
+            return False
+        return True
+
+    @staticmethod
+    def _normalize_time_claims(claims: dict) -> dict:
+        for claim in _time_claims:
+            if isinstance(claims.get(claim), datetime):
+                claims = claims.copy()
+                claims[claim] = calendar.timegm(claims[claim].utctimetuple())
+        return claims
+
+    def sign(self, claims: dict, key: KeyMaterial) -> str:
+        signing_input = (self._encoded_header(key) + b"." +
+                         b64url_encode(orjson.dumps(self._normalize_time_claims(claims))))
+        return (signing_input + b"." + b64url_encode(self._sign_bytes(signing_input, key))).decode("ascii")
+
+    def sign_many(self, claims_list: list[dict], key: KeyMaterial) -> list[str]:
+        # Заголовок и ключ общие для всей пачки, в цикле остаются только сериализация и подпись
+        header = self._encoded_header(key) + b"."
+        normalize, sign_bytes = self._normalize_time_claims, self._sign_bytes
+        tokens = []
+        for claims in claims_list:
+            signing_input = header + b64url_encode(orjson.dumps(normalize(claims)))
+            tokens.append((signing_input + b"." + b64url_encode(sign_bytes(signing_input, key))).decode("ascii"))
+        return tokens
+
+    def decode(self, token: str, key_lookup: KeyLookup) -> dict:
+        try:
+            signing_input, signature = token.encode("ascii").rsplit(b".", 1)
+            encoded_header, encoded_claims = signing_input.split(b".", 1)
+            header = orjson.loads(b64url_decode(encoded_header))
+            signature = b64url_decode(signature)
+        except (ValueError, binascii.Error, orjson.JSONDecodeError):
+            raise JWTError("Malformed token")
+        if not isinstance(header, dict):
+            raise JWTError("Malformed token")
+
+        if not (key := key_lookup(header.get("kid"))):
+            raise JWTError("Unknown key id")
+        if header.get("alg") != key.alg:
+            raise JWTError("The specified alg value is not allowed")
+        if not self._verify_bytes(signing_input, signature, key):
+            raise JWTError("Signature verification failed.")
+
+        try:
+            claims = orjson.loads(b64url_decode(encoded_claims))
+        except (ValueError, binascii.Error):
+            raise JWTError("Invalid payload")
+        if not isinstance(claims, dict):
+            raise JWTError("Invalid payload")
+
+        now = time.time()
+        try:
+            if "exp" in claims and not now < claims["exp"]:
+                raise ExpiredSignatureError("Signature has expired.")
+            if "nbf" in claims and now < claims["nbf"]:
+                raise JWTError("The token is not yet valid (nbf)")
+        except TypeError:
+            raise JWTError("Invalid time claim")
+        return claims
+
+
+jws_backends: dict[str, type[JWSBackend]] = {
+    JoseBackend.name: JoseBackend,
+    CryptographyBackend.name: CryptographyBackend,
+}
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import orjson
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jose import jwk
+from jose.backends.base import Key
+from jose.utils import base64url_encode, long_to_base64
+
+from .cache import strong_etag
+from .settings import get_settings, get_private_key_pem, get_public_key_pem
+
+logger = logging.getLogger(__name__)
+
+# Обязательные члены JWK для отпечатка по RFC 7638
+_thumbprint_members = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+    "OKP": ("crv", "kty", "x"),
+}
+
+_ec_curves = {
+    "secp256r1": ("P-256", "ES256"),
+    "secp384r1": ("P-384", "ES384"),
+    "secp521r1": ("P-521", "ES512"),
+}
+
+# Алгоритмы, которые умеет python-jose; EdDSA подписывается только бэкендом cryptography
+_jose_algs = {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+
+
+def jwk_thumbprint(public_jwk: dict) -> str:
+    members = {k: public_jwk[k] for k in _thumbprint_members[public_jwk["kty"]]}
+    digest = hashlib.sha256(json.dumps(members, separators=(",", ":"), sort_keys=True).encode()).digest()
+    return base64url_encode(digest).decode("ascii")
+
+
+def public_key_to_jwk(public_key) -> dict:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        numbers = public_key.public_numbers()
+        return {"kty": "RSA",
+                "n": long_to_base64(numbers.n).decode("ascii"),
+                "e": long_to_base64(numbers.e).decode("ascii")}
+    if isinstance(public_key, ec.EllipticCurvePublicKey):
+        numbers = public_key.public_numbers()
+        size = (public_key.curve.key_size + 7) // 8
+        return {"kty": "EC",
+                "crv": _ec_curves[public_key.curve.name][0],
+                "x": long_to_base64(numbers.x, size).decode("ascii"),
+                "y": long_to_base64(numbers.y, size).decode("ascii")}
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        raw = public_key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        return {"kty": "OKP", "crv": "Ed25519", "x": base64url_encode(raw).decode("ascii")}
+    raise ValueError(f"Unsupported key type: {type(public_key).__name__}")
+
+
+def resolve_alg(public_key, configured: str | None) -> str:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        allowed = ("RS256", "RS384", "RS512")
+    elif isinstance(public_key, ec.EllipticCurvePublicKey):
+        allowed = (_ec_curves[public_key.curve.name][1],)
+    elif isinstance(public_key, ed25519.Ed25519PublicKey):
+        allowed = ("EdDSA",)
+    else:
+        raise ValueError(f"Unsupported key type: {type(public_key).__name__}")
+
+    if configured is None:
+        return allowed[0]
+    if configured not in allowed:
+        raise ValueError(f"jws_alg={configured} does not match the key type, expected one of {allowed}")
+    return configured
+
+
+class KeyMaterial:
+    """Разобранная пара ключей, готовая к подписи и проверке без повторного парсинга PEM."""
+
+    __slots__ = ("kid", "alg", "signing_key", "verifying_key", "private_key", "public_key", "public_jwk",
+                 "loaded_at", "expires_at")
+
+    def __init__(self, private_pem: str, public_pem: str, alg: str | None = None,
+                 lifetime: timedelta | None = None, issued_at: datetime | None = None):
+        self.private_key = serialization.load_pem_private_key(private_pem.encode(), password=None)
+        self.public_key = serialization.load_pem_public_key(public_pem.encode())
+        self.alg = resolve_alg(self.public_key, alg)
+
+        self.public_jwk: dict = public_key_to_jwk(self.public_key)
+        if public_key_to_jwk(self.private_key.public_key()) != self.public_jwk:
+            raise ValueError("Private and public keys do not form a pair")
+        self.kid = jwk_thumbprint(self.public_jwk)
+        self.public_jwk.update({"kid": self.kid, "use": "sig", "alg": self.alg})
+
+        # Ключевые объекты jose для бэкенда "jose", если он поддерживает алгоритм
+        self.signing_key: Key | None = None
+        self.verifying_key: Key | None = None
+        if self.alg in _jose_algs:
+            self.signing_key = jwk.construct(private_pem, self.alg)
+            self.verifying_key = jwk.construct(self.public_key, self.alg)
+
+        self.loaded_at = datetime.now(timezone.utc)
+        self.expires_at = (issued_at or self.loaded_at) + lifetime if lifetime else None
+
+
+class KeyStore:
+    def __init__(self, private_path: str, public_path: str, alg: str | None, reload_interval: float,
+                 lifetime: timedelta | None = None):
+        self.private_path = private_path
+        self.public_path = public_path
+        self.alg = alg
+        self.reload_interval = reload_interval
+        self.lifetime = lifetime
+
+        self._current: KeyMaterial | None = None
+        # Предыдущий ключ оставляем для проверки уже выданных токенов после ротации
+        self._previous: KeyMaterial | None = None
+        self._mtimes: tuple[int, int] | None = None
+        self._checked_at = 0.0
+        # (kid текущего и предыдущего ключа, сериализованный JWKS, ETag)
+        self._jwks_document: tuple[tuple, bytes, str] | None = None
+
+    def _stat(self) -> tuple[int, int]:
+        return os.stat(self.private_path).st_mtime_ns, os.stat(self.public_path).st_mtime_ns
+
+    def _load(self, mtimes: tuple[int, int]) -> KeyMaterial:
+        issued_at = datetime.fromtimestamp(mtimes[0] / 1e9, timezone.utc)
+        return KeyMaterial(get_private_key_pem(), get_public_key_pem(), self.alg, self.lifetime, issued_at)
+
+    def reload(self, force: bool = False):
+        self._checked_at = time.monotonic()
+        try:
+            mtimes = self._stat()
+            if not force and mtimes == self._mtimes:
+                return
+            material = self._load(mtimes)
+        except Exception:
+            # При неатомарной ротации файла может не быть или он записан не полностью —
+            # продолжаем работать со старым ключом, _mtimes не трогаем, чтобы повторить проверку
+            if self._current is None:
+                raise
+            logger.exception("Failed to reload signing keys, keeping kid=%s", self._current.kid)
+            return
+        self._mtimes = mtimes
+        if self._current is None or material.kid != self._current.kid:
+            self._previous, self._current = self._current, material
+            logger.info("Loaded signing key kid=%s alg=%s", material.kid, material.alg)
+
+    def _ensure_fresh(self):
+        if self._current is None or time.monotonic() - self._checked_at >= self.reload_interval:
+            self.reload()
+
+    @property
+    def signing_key(self) -> KeyMaterial:
+        self._ensure_fresh()
+        return self._current
+
+    def verification_keys(self) -> dict[str, KeyMaterial]:
+        self._ensure_fresh()
+        return {key.kid: key for key in (self._current, self._previous) if key is not None}
+
+    def jwks(self) -> dict:
+        return {"keys": [key.public_jwk for key in self.verification_keys().values()]}
+
+    def jwks_document(self) -> tuple[bytes, str]:
+        """JWKS в байтах и сильный ETag; сериализуется один раз на набор ключей."""
+        keys = self.verification_keys()
+        version = tuple(keys)
+        if self._jwks_document is None or self._jwks_document[0] != version:
+            body = orjson.dumps({"keys": [key.public_jwk for key in keys.values()]})
+            self._jwks_document = (version, body, strong_etag(body))
+        return self._jwks_document[1], self._jwks_document[2]
+
+    def get_verification_key(self, kid: str | None) -> KeyMaterial | None:
+        keys = self.verification_keys()
+        if kid is None:
+            return self._current
+        return keys.get(kid)
+
+
+key_store = KeyStore(get_settings().secret_key_path,
+                     get_settings().public_key_path,
+                     get_settings().jws_alg,
+                     get_settings().key_reload_interval,
+                     timedelta(days=get_settings().signing_key_lifetime_days))
@@ -0,0 +1,43 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class LatencyHistogram:
+    """Скользящее окно последних измерений (мс); перцентили считаются по запросу."""
+
+    def __init__(self, name: str, window: int = 4096):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        named_histograms[name] = self
+
+    def observe(self, milliseconds: float):
+        self._samples.append(milliseconds)
+        self.count += 1
+
+    @contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe((time.perf_counter() - started) * 1000)
+
+    def stats(self) -> dict:
+        samples = sorted(self._samples)
+        if not samples:
+            return {'count': self.count}
+
+        def pct(p: float) -> float:
+            return round(samples[min(len(samples) - 1, int(len(samples) * p / 100))], 4)
+
+        return {'count': self.count,
+                'window': len(samples),
+                'p50_ms': pct(50),
+                'p90_ms': pct(90),
+                'p99_ms': pct(99),
+                'max_ms': round(samples[-1], 4)}
+
+
+# Отдаются в /metrics/latency
+named_histograms: dict[str, LatencyHistogram] = {}
@@ -0,0 +1,30 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PurgeJob:
+    """Периодически вызывает store.purge(). In-memory хранилища чистит колесо
+    таймеров, у них needs_purge = False и задача не запускается."""
+
+    def __init__(self, store, interval: float):
+        self.store = store
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.store.purge()
+            except Exception:
+                logger.exception("Purge failed for %s", type(self.store).__name__)
+
+    async def start(self):
+        if self.store.needs_purge:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
@@ -0,0 +1,123 @@
+import asyncio
+import datetime
+import math
+
+from tortoise.transactions import in_transaction
+
+from .invalidation import invalidation_bus
+from .purge import PurgeJob
+from .settings import get_settings
+from ..models import RevokedTokens
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(capacity, 1)
+        self.size = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        # Двойное хеширование. Фильтр живёт только в памяти процесса, поэтому
+        # достаточно встроенного hash() — он кэшируется в объекте строки
+        h1 = hash(item)
+        h2 = hash((item, self.size)) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class RevocationList:
+    """Отозванные jti в памяти воркера: Bloom-фильтр отсекает неотозванные токены,
+    положительный ответ сверяется с точным множеством, так что проверка токена
+    никогда не идёт в БД. Множество загружается из RevokedTokens при старте,
+    пополняется событиями шины и перечитывается после очистки истёкших записей."""
+
+    needs_purge = True
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._revoked: set[str] = set()
+        # jti, пришедшие во время загрузки из БД
+        self._pending: list[str] | None = None
+        self._reload_task: asyncio.Task | None = None
+
+    def _rebuild(self):
+        self.capacity = max(self.capacity, len(self._revoked) * 2)
+        bloom = BloomFilter(self.capacity, self.error_rate)
+        for jti in self._revoked:
+            bloom.add(jti)
+        self._filter = bloom
+
+    def add(self, jti: str):
+        self._revoked.add(jti)
+        self._filter.add(jti)
+        if self._pending is not None:
+            self._pending.append(jti)
+        if len(self._revoked) > self.capacity:
+            # Фильтр переполнен и врёт чаще заданного: пересобираем из множества, без БД
+            self._rebuild()
+
+    def is_revoked(self, jti: str | None) -> bool:
+        return jti is not None and jti in self._filter and jti in self._revoked
+
+    async def load(self):
+        self._pending = []
+        try:
+            async with in_transaction() as conn:
+                jtis = await RevokedTokens.filter(
+                        expires_at__gt=datetime.datetime.now(datetime.timezone.utc)).using_db(conn).values_list(
+                        'jti', flat=True)
+            self._revoked = set(jtis) | set(self._pending)
+            self._rebuild()
+        finally:
+            self._pending = None
+
+    def reload(self):
+        if not self._reload_task or self._reload_task.done():
+            self._reload_task = asyncio.get_running_loop().create_task(self.load())
+
+    def on_invalidation(self, key: str | None):
+        if key is None:
+            # События могли потеряться — перечитываем список из БД
+            self.reload()
+            return
+        self.add(key)
+
+    async def revoke(self, jti: str, expires_at: float):
+        async with in_transaction() as conn:
+            await RevokedTokens.get_or_create(
+                    jti=jti,
+                    defaults={'expires_at': datetime.datetime.fromtimestamp(expires_at, datetime.timezone.utc)},
+                    using_db=conn)
+            await invalidation_bus.publish('revocations', jti, using_db=conn)
+
+    async def purge(self) -> int:
+        # Из Bloom удалить нельзя: после очистки таблицы перечитываем множество и собираем фильтр заново
+        async with in_transaction() as conn:
+            purged = await RevokedTokens.filter(
+                    expires_at__lt=datetime.datetime.now(datetime.timezone.utc)).using_db(conn).delete()
+        await self.load()
+        return purged
+
+    def stats(self) -> dict:
+        return {'revoked': len(self._revoked),
+                'filter_bits': self._filter.size,
+                'filter_hashes': self._filter.hashes}
+
+
+revocation_list = RevocationList(get_settings().revocation_filter_capacity)
+invalidation_bus.subscribe('revocations', revocation_list.on_invalidation)
+revocation_purge_job = PurgeJob(revocation_list, get_settings().revocation_purge_interval)
@@ -0,0 +1,41 @@
+from functools import lru_cache
+from typing import Iterable
+
+from .security import oauth_scopes
+
+
+class ScopeRegistry:
+    """Каждому известному scope — свой бит. Строки scope разбираются в маски один
+    раз (LRU), проверка "подмножество" — побитовая операция."""
+
+    def __init__(self, scopes: Iterable[str], cache_size: int = 1024):
+        self.names = tuple(scopes)
+        self.bits = {name: 1 << position for position, name in enumerate(self.names)}
+        self.all = (1 << len(self.names)) - 1
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+        self.parse_known = lru_cache(maxsize=cache_size)(self._parse_known)
+        self.to_string = lru_cache(maxsize=cache_size)(self._to_string)
+
+    def _parse(self, scope: str) -> int | None:
+        """None, если в строке есть неизвестный scope."""
+        mask = 0
+        for name in scope.split():
+            if (bit := self.bits.get(name)) is None:
+                return None
+            mask |= bit
+        return mask
+
+    def _parse_known(self, scope: str) -> int:
+        # Для scope клиентов из БД: неизвестные значения просто не дают прав
+        names = set(scope.split())
+        return sum(bit for name, bit in self.bits.items() if name in names)
+
+    def _to_string(self, mask: int) -> str:
+        return ' '.join(name for name, bit in self.bits.items() if mask & bit)
+
+    @staticmethod
+    def contains(granted: int, requested: int) -> bool:
+        return not requested & ~granted
+
+
+scope_registry = ScopeRegistry(oauth_scopes)
@@ -1,10 +1,19 @@
+import asyncio
+import hashlib
+import hmac
+import secrets
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import jwt
+from jose import JWTError
 from passlib.context import CryptContext
 
-from .settings import get_settings, get_rsa_private, get_rsa_public
+from .jws import jws_backends
+from .keys import key_store
+from .revocation import revocation_list
+from .settings import get_settings
+from ..exceptions import PasswordHasherOverloadedError
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -16,26 +25,106 @@ oauth_scopes = {
 }
 
 
-def verify_password(plain, hashed):
+def _verify_password_sync(plain, hashed):
     return pwd_context.verify(plain, hashed)
 
 
-def get_password_hash(plain):
+def _get_password_hash_sync(plain):
     return pwd_context.hash(plain)
 
 
+class PasswordHasher:
+    """Выполняет bcrypt в пуле потоков/процессов, чтобы не блокировать event loop."""
+
+    def __init__(self, executor_type: str, max_workers: int, max_pending: int):
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: Executor | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="pwd-hasher")
+        return self._executor
+
+    async def run(self, func, *args):
+        # Очередь ограничена: при переполнении сразу отдаём 503, а не копим запросы
+        if self.pending >= self.max_pending:
+            raise PasswordHasherOverloadedError()
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+jws_backend = jws_backends[get_settings().jws_backend]()
+
+password_hasher = PasswordHasher(get_settings().pwd_hash_executor,
+                                 get_settings().pwd_hash_workers,
+                                 get_settings().pwd_hash_max_pending)
+
+
+async def verify_password(plain, hashed):
+    return await password_hasher.run(_verify_password_sync, plain, hashed)
+
+
+async def get_password_hash(plain):
+    return await password_hasher.run(_get_password_hash_sync, plain)
+
+
+# Секреты клиентов генерируются сервером и имеют высокую энтропию, поэтому вместо
+# bcrypt достаточно HMAC-SHA256 с серверным ключом: проверка занимает микросекунды
+def generate_client_secret(nbytes: int = 32) -> str:
+    return secrets.token_urlsafe(nbytes)
+
+
+def hash_client_secret(secret: str) -> str:
+    return hmac.new(get_settings().client_secret_key.encode(), secret.encode(), hashlib.sha256).hexdigest()
+
+
+def verify_client_secret(secret_hash: str, stored_hash: str | None) -> bool:
+    return bool(stored_hash) and hmac.compare_digest(secret_hash.encode(), stored_hash.encode())
+
+
+def get_jwt_lifetime(expires_delta: Optional[timedelta] = None) -> timedelta:
+    return expires_delta or timedelta(get_settings().default_jwt_exp)
+
+
+def generate_jti() -> str:
+    return secrets.token_urlsafe(16)
+
+
 async def create_jwt(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(get_settings().default_jwt_exp)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, get_rsa_private(), algorithm=get_settings().jws_alg)
+    expire = datetime.now(timezone.utc) + get_jwt_lifetime(expires_delta)
+    to_encode.update({"iss": get_settings().issuer.rstrip("/"), "exp": expire, "jti": generate_jti()})
+    return jws_backend.sign(to_encode, key_store.signing_key)
+
+
+async def create_jwt_many(data: list[dict], expires_delta: Optional[timedelta] = None) -> list[str]:
+    expire = int((datetime.now(timezone.utc) + get_jwt_lifetime(expires_delta)).timestamp())
+    issuer = get_settings().issuer.rstrip("/")
+    return jws_backend.sign_many([{**item, "iss": issuer, "exp": expire, "jti": generate_jti()} for item in data],
+                                 key_store.signing_key)
 
 
 async def decode_jwt(token: str):
-    return jwt.decode(token, get_rsa_public(), algorithms=get_settings().jws_alg)
+    claims = jws_backend.decode(token, key_store.get_verification_key)
+    # Проверка идёт только по памяти воркера (Bloom-фильтр и множество jti), без запросов к БД
+    if revocation_list.is_revoked(claims.get("jti")):
+        raise JWTError("Token has been revoked")
+    return claims
 
 
 class Policies:
@@ -1,5 +1,7 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
+
 from pydantic import UUID4
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -14,15 +16,59 @@ class Settings(BaseSettings):
     db_port: int
     db_name: str
 
-    jws_alg: str = "RS256"
+    # Если не задан, определяется по типу ключа: RSA -> RS256, P-256 -> ES256, Ed25519 -> EdDSA
+    jws_alg: str | None = None
+    jws_backend: Literal["jose", "cryptography"] = "cryptography"
     default_jwt_exp: int = 30
+    token_batch_max_size: int = 1000
     software_statement_exp_days: int = 3
 
+    pwd_hash_executor: Literal["thread", "process"] = "thread"
+    pwd_hash_workers: int = 4
+    pwd_hash_max_pending: int = 64
+
     secret_key_path: str
     public_key_path: str
+    key_reload_interval: float = 5.0
+    signing_key_lifetime_days: int = 90
+    # Должно быть меньше интервала ротации: предыдущий ключ публикуется только до следующей
+    jwks_max_age: int = 300
+
+    # Публичный адрес сервера: issuer и база для URL в метаданных (RFC 8414)
+    issuer: str = "http://localhost:8000"
+    metadata_max_age: int = 3600
+    registration_form_max_age: int = 300
+    # Языки локализованных метаданных клиента ("client_name#ja-JP"), JSON-список тегов.
+    # Не задано — все теги из utils/i18n.py
+    lang_tags: list[str] | None = None
 
     client_id: UUID4
 
+    client_secret_key: str
+    client_cache_size: int = 10000
+    client_cache_ttl: float = 300.0
+
+    # "postgres" — LISTEN/NOTIFY между воркерами, "local" — только внутри процесса
+    invalidation_backend: Literal["local", "postgres"] = "postgres"
+
+    # Код погашается на любом воркере; "memory" — без записи в БД, только для одного процесса
+    auth_code_store: Literal["memory", "postgres"] = "postgres"
+    auth_code_ttl: int = 60
+    auth_code_purge_interval: float = 30.0
+
+    # refresh-токены живут дни, поэтому по умолчанию в БД; "memory" — для одного процесса
+    refresh_token_store: Literal["memory", "postgres"] = "postgres"
+    refresh_token_ttl_days: int = 30
+    refresh_token_purge_interval: float = 3600.0
+
+    introspection_cache_size: int = 50000
+
+    revocation_filter_capacity: int = 100000
+    revocation_purge_interval: float = 3600.0
+
+    # Bearer-токен для /metrics/*; не задан — метрики отключены
+    metrics_token: str | None = None
+
 
 __settings = Settings()
 
@@ -32,14 +78,13 @@ def get_settings() -> Settings:
     return __settings
 
 
-@lru_cache()
-def get_rsa_private() -> str:
+# Не кэшируем: ключи держит разобранными utils.keys.KeyStore и перечитывает при изменении файлов
+def get_private_key_pem() -> str:
     with open(get_settings().secret_key_path, encoding='utf-8') as f:
         return f.read()
 
 
-@lru_cache()
-def get_rsa_public() -> str:
+def get_public_key_pem() -> str:
     with open(get_settings().public_key_path, encoding='utf-8') as f:
         return f.read()
 
@@ -1,5 +1,37 @@
 from pathlib import Path
+from typing import Callable, Hashable
 
+from fastapi import Request
 from fastapi.templating import Jinja2Templates
 
+from .cache import LRUCache, strong_etag
+
 templates = Jinja2Templates(directory=(Path(__file__).parent / '..' / 'templates').as_posix())
+
+
+class PageCache:
+    """Страница, которая меняется только с деплоем. Контекст строится один раз (prepare при
+    старте), HTML рендерится один раз на адрес сервера — от него зависят ссылки url_for —
+    и локаль, дальше отдаются готовые байты с ETag."""
+
+    def __init__(self, template: str, context_factory: Callable[[], dict], maxsize: int = 32,
+                 name: str | None = None):
+        self.template = template
+        self.context_factory = context_factory
+        self._context: dict | None = None
+        self._pages = LRUCache(maxsize, name=name)
+
+    def prepare(self):
+        self._context = self.context_factory()
+        self._pages.clear()
+
+    def get(self, request: Request, locale: Hashable = None) -> tuple[bytes, str]:
+        key = (str(request.base_url), locale)
+        if (page := self._pages.get(key)) is None:
+            if self._context is None:
+                self.prepare()
+            body = templates.get_template(self.template).render(
+                    {'request': request, 'locale': locale, **self._context}).encode()
+            page = body, strong_etag(body)
+            self._pages.set(key, page)
+        return page
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict
+from typing import Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+# Получает пачку ключей, истёкших за один проход колеса
+ExpiryCallback = Callable[[list[Hashable]], None]
+
+
+class Timer:
+    __slots__ = ("tick", "owner", "key", "bucket")
+
+    def __init__(self, tick: int, owner: str, key: Hashable):
+        self.tick = tick
+        self.owner = owner
+        self.key = key
+        self.bucket: set | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.bucket is not None
+
+
+class TimingWheel:
+    """Иерархическое колесо таймеров. Уровень i делит время на блоки по
+    prod(sizes[:i]) тиков; таймер кладётся на самый младший уровень, где до
+    его блока меньше sizes[i] блоков, и спускается вниз при обороте младшего
+    колеса. Вставка и отмена — O(1), срабатывания раздаются владельцам пачками."""
+
+    def __init__(self, resolution: float = 1.0, sizes: tuple[int, ...] = (256, 64, 64, 64)):
+        self.resolution = resolution
+        self.sizes = sizes
+        self._spans = [math.prod(sizes[:level]) for level in range(len(sizes))]
+        self._wheels: list[list[set[Timer]]] = [[set() for _ in range(size)] for size in sizes]
+        self._tick = self._to_tick(time.time())
+        self._callbacks: dict[str, ExpiryCallback] = {}
+        self._count = 0
+        self._task: asyncio.Task | None = None
+
+    def _to_tick(self, timestamp: float) -> int:
+        return int(timestamp // self.resolution)
+
+    def register(self, owner: str, callback: ExpiryCallback):
+        self._callbacks[owner] = callback
+
+    def _place(self, timer: Timer, base: int):
+        target = max(timer.tick, base)
+        if target - base < self.sizes[0]:
+            bucket = self._wheels[0][target % self.sizes[0]]
+            bucket.add(timer)
+            timer.bucket = bucket
+            return
+        for level, (size, span) in enumerate(zip(self.sizes, self._spans)):
+            if target // span - base // span < size:
+                bucket = self._wheels[level][(target // span) % size]
+                break
+        else:
+            # Дальше горизонта: в последний слот старшего уровня, при спуске таймер переложится заново
+            level, span = len(self.sizes) - 1, self._spans[-1]
+            bucket = self._wheels[level][(base // span - 1) % self.sizes[level]]
+        bucket.add(timer)
+        timer.bucket = bucket
+
+    def schedule(self, owner: str, key: Hashable, deadline: float) -> Timer:
+        """deadline — unix time; срабатывание не раньше deadline и не позже чем через тик после."""
+        timer = Timer(math.ceil(deadline / self.resolution), owner, key)
+        self._place(timer, self._tick + 1)
+        self._count += 1
+        return timer
+
+    def cancel(self, timer: Timer):
+        if timer.bucket is not None:
+            timer.bucket.discard(timer)
+            timer.bucket = None
+            self._count -= 1
+
+    def _step(self) -> set[Timer]:
+        self._tick += 1
+        tick = self._tick
+        for level in range(len(self.sizes) - 1, 0, -1):
+            span = self._spans[level]
+            if tick % span:
+                continue
+            bucket = self._wheels[level][(tick // span) % self.sizes[level]]
+            if bucket:
+                self._wheels[level][(tick // span) % self.sizes[level]] = set()
+                for timer in bucket:
+                    self._place(timer, tick)
+        expired = self._wheels[0][tick % self.sizes[0]]
+        if expired:
+            self._wheels[0][tick % self.sizes[0]] = set()
+        return expired
+
+    def advance(self, now: float | None = None) -> int:
+        """Прокручивает колесо до now и вызывает обработчики; возвращает число истёкших таймеров."""
+        target = self._to_tick(time.time() if now is None else now)
+        if not self._count:
+            self._tick = max(self._tick, target)
+            return 0
+
+        batches: dict[str, list[Hashable]] = defaultdict(list)
+        while self._tick < target and self._count:
+            for timer in self._step():
+                timer.bucket = None
+                self._count -= 1
+                batches[timer.owner].append(timer.key)
+        self._tick = max(self._tick, target)
+
+        for owner, keys in batches.items():
+            if not (callback := self._callbacks.get(owner)):
+                continue
+            try:
+                callback(keys)
+            except Exception:
+                logger.exception("Expiry callback failed for %s", owner)
+        return sum(map(len, batches.values()))
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.resolution - time.time() % self.resolution)
+            self.advance()
+
+    async def start(self):
+        self._tick = max(self._tick, self._to_tick(time.time()))
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+
+    def __len__(self):
+        return self._count
+
+
+expiry_wheel = TimingWheel()
@@ -0,0 +1,99 @@
+import orjson
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+from ..models import GrantTypesEnum, ResponseTypesEnum, TokenEndpointAuthMethodsEnum
+from ..oauth.routes import supported_grant_types, supported_response_types, token_endpoint_auth_methods
+from ..utils.cache import strong_etag
+from ..utils.security import oauth_scopes
+from ..utils.settings import get_settings
+
+# Поле метаданных -> маршрут, который объявляем в документе. Документ строится из этой таблицы,
+# а при старте сверяется с тем, что реально смонтировано в приложении
+endpoint_routes = {
+    'authorization_endpoint': ('GET', '/oauth/authorize'),
+    'token_endpoint': ('POST', '/oauth/token'),
+    'registration_endpoint': ('POST', '/oauth/register'),
+    'introspection_endpoint': ('POST', '/oauth/introspect'),
+    'revocation_endpoint': ('POST', '/oauth/revoke'),
+    'jwks_uri': ('GET', '/.well-known/jwks.json'),
+}
+
+# Где отдаются сами документы discovery. openid-configuration не отдаём: id_token сервер не выпускает
+document_routes = {
+    'oauth-authorization-server': ('GET', '/.well-known/oauth-authorization-server'),
+}
+
+
+class MetadataError(RuntimeError):
+    pass
+
+
+def mounted_routes(app: FastAPI) -> set[tuple[str, str]]:
+    return {(method, route.path) for route in app.routes if isinstance(route, APIRoute) for method in route.methods}
+
+
+def build_server_metadata(issuer: str) -> dict:
+    metadata = {'issuer': issuer}
+    metadata |= {field: issuer + path for field, (_, path) in endpoint_routes.items()}
+    metadata |= {
+        'scopes_supported': list(oauth_scopes),
+        'response_types_supported': [response_type.value for response_type in ResponseTypesEnum
+                                     if response_type.value in supported_response_types],
+        'grant_types_supported': [grant_type.value for grant_type in GrantTypesEnum
+                                  if grant_type.value in supported_grant_types],
+        'token_endpoint_auth_methods_supported': [method.value for method in TokenEndpointAuthMethodsEnum
+                                                  if method.value in token_endpoint_auth_methods],
+        'introspection_endpoint_auth_methods_supported': ['client_secret_basic'],
+        'revocation_endpoint_auth_methods_supported': list(token_endpoint_auth_methods),
+    }
+    return metadata
+
+
+def check_server_metadata(app: FastAPI, metadata: dict):
+    """Всё, что объявлено в документе, должно быть смонтировано в приложении: сервер не запустится,
+    если маршрут переименовали или убрали, а метаданные остались прежними."""
+    routes = mounted_routes(app)
+    issuer = metadata['issuer']
+    problems = []
+    for field, (method, _) in endpoint_routes.items():
+        if not metadata.get(field, '').startswith(issuer):
+            problems.append(f"{field}: {metadata.get(field)} is not under issuer {issuer}")
+        elif (method, metadata[field].removeprefix(issuer)) not in routes:
+            problems.append(f"{field}: {metadata[field]} is not served by a mounted {method} route")
+    for name, route in document_routes.items():
+        if route not in routes:
+            problems.append(f"{name}: document route {route} is not mounted")
+    if unknown := set(supported_response_types) - {response_type.value for response_type in ResponseTypesEnum}:
+        problems.append(f"response types {sorted(unknown)} are not in ResponseTypesEnum")
+    if unknown := set(supported_grant_types) - {grant_type.value for grant_type in GrantTypesEnum}:
+        problems.append(f"grant types {sorted(unknown)} are not in GrantTypesEnum")
+    if unknown := set(token_endpoint_auth_methods) - {method.value for method in TokenEndpointAuthMethodsEnum}:
+        problems.append(f"auth methods {sorted(unknown)} are not in TokenEndpointAuthMethodsEnum")
+    if problems:
+        raise MetadataError("Inconsistent authorization server metadata: " + "; ".join(problems))
+
+
+class MetadataDocuments:
+    """Документы discovery, собранные и сериализованные один раз при старте."""
+
+    def __init__(self):
+        self._documents: dict[str, tuple[bytes, str]] = {}
+
+    @staticmethod
+    def _render(document: dict) -> tuple[bytes, str]:
+        body = orjson.dumps(document)
+        return body, strong_etag(body)
+
+    def build(self, app: FastAPI):
+        server_metadata = build_server_metadata(get_settings().issuer.rstrip('/'))
+        check_server_metadata(app, server_metadata)
+        self._documents = {
+            'oauth-authorization-server': self._render(server_metadata),
+        }
+
+    def get(self, name: str) -> tuple[bytes, str]:
+        return self._documents[name]
+
+
+metadata_documents = MetadataDocuments()
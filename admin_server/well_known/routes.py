@@ -0,0 +1,23 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Header
+
+from .metadata import metadata_documents
+from ..utils.cache import cached_response
+from ..utils.keys import key_store
+from ..utils.settings import get_settings
+
+router = APIRouter(prefix='/.well-known')
+
+
+@router.get('/jwks.json')
+async def get_jwks(if_none_match: Annotated[str | None, Header()] = None):
+    body, etag = key_store.jwks_document()
+    return cached_response(body, etag, get_settings().jwks_max_age, if_none_match)
+
+
+@router.get('/oauth-authorization-server')
+async def get_server_metadata(if_none_match: Annotated[str | None, Header()] = None):
+    body, etag = metadata_documents.get('oauth-authorization-server')
+    return cached_response(body, etag, get_settings().metadata_max_age, if_none_match)
+
@@ -0,0 +1,112 @@
+# Регистрации клиентов в секунду: минимальный запрос против запроса со всеми локализациями.
+# Считаются SQL-запросы на одну регистрацию и отдельно время подготовки строк (без БД).
+#   python -m dev.benchmarks.client_registration --db sqlite --registrations 500
+#   python -m dev.benchmarks.client_registration --db postgres   # нужна БД из admin_server/.env
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+import uuid
+
+from .common import prepare_env, percentile
+
+prepare_env()
+if "--db" not in sys.argv or "postgres" not in sys.argv:
+    # sqlite в памяти: шина инвалидации без LISTEN/NOTIFY
+    os.environ.setdefault("INVALIDATION_BACKEND", "local")
+
+from tortoise import Tortoise  # noqa: E402
+
+from admin_server.oauth.reg_utils import split_registration  # noqa: E402
+from admin_server.oauth.routes import process_registration  # noqa: E402
+from admin_server.schemas import ClientRegistrationRequest  # noqa: E402
+from admin_server.utils.settings import TORTOISE_ORM  # noqa: E402
+
+
+class StatementCounter(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.count = 0
+
+    def emit(self, record):
+        self.count += 1
+
+
+def minimal_request() -> dict:
+    return {"redirect_uris": ["https://client.example.org/callback"],
+            "grant_types": ["authorization_code"],
+            "response_types": ["code"],
+            "software_statement": "bench"}
+
+
+def localized_request() -> dict:
+    request = {"redirect_uris": [f"https://client.example.org/callback/{i}" for i in range(5)],
+               "grant_types": ["authorization_code", "refresh_token"],
+               "response_types": ["code"],
+               "contacts": ["admin@client.example.org", "ops@client.example.org"],
+               "client_name": "Bench client",
+               "tos_uri": "https://client.example.org/tos",
+               "policy_uri": "https://client.example.org/policy",
+               "logo_uri": "https://client.example.org/logo.png",
+               "client_uri": "https://client.example.org/",
+               "software_statement": "bench"}
+    for field in ClientRegistrationRequest.model_fields.values():
+        if field.alias and '#' in field.alias:
+            base, _, lang_tag = field.alias.partition('#')
+            request[field.alias] = (f"Bench client ({lang_tag})" if base == "client_name"
+                                    else f"https://client.example.org/{base}/{lang_tag}")
+    return request
+
+
+async def run_case(name: str, body: dict, registrations: int, counter: StatementCounter):
+    request = ClientRegistrationRequest.model_validate(body)
+
+    began = time.perf_counter()
+    for _ in range(registrations):
+        split_registration(uuid.uuid4(), request.model_dump(by_alias=True, exclude_unset=True))
+    prepare_us = (time.perf_counter() - began) / registrations * 1e6
+
+    latencies = []
+    counter.count = 0
+    started = time.perf_counter()
+    for _ in range(registrations):
+        began = time.perf_counter()
+        await process_registration(request)
+        latencies.append((time.perf_counter() - began) * 1000)
+    elapsed = time.perf_counter() - started
+
+    print(f"{name}: {len(request.model_fields_set)} fields set, "
+          f"{registrations / elapsed:,.0f} registrations/s, "
+          f"p50 {percentile(latencies, 50):.3f} ms, p99 {percentile(latencies, 99):.3f} ms, "
+          f"{counter.count / registrations:.1f} SQL statements per registration, "
+          f"payload build {prepare_us:.0f} us")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--db', choices=('sqlite', 'postgres'), default='sqlite')
+    parser.add_argument('--registrations', type=int, default=500)
+    args = parser.parse_args()
+
+    if args.db == 'sqlite':
+        await Tortoise.init(db_url='sqlite://:memory:', modules={'main': ['admin_server.models']})
+    else:
+        await Tortoise.init(config=TORTOISE_ORM)
+    await Tortoise.generate_schemas(safe=True)
+
+    counter = StatementCounter()
+    db_logger = logging.getLogger('tortoise.db_client')
+    db_logger.setLevel(logging.DEBUG)
+    db_logger.addHandler(counter)
+    db_logger.propagate = False
+    try:
+        await run_case("minimal", minimal_request(), args.registrations, counter)
+        await run_case("localized", localized_request(), args.registrations, counter)
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
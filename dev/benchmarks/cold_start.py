@@ -0,0 +1,54 @@
+# Холодный старт воркера admin_server и его память для полного и сокращённого набора языков
+# (настройка LANG_TAGS). Каждый вариант — отдельный процесс: импорт admin_server.main,
+# подготовка формы регистрации и OpenAPI, как при первом запросе к /docs.
+#   python -m dev.benchmarks.cold_start --tags en-US ru-RU ja-JP --runs 3
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from .common import prepare_env
+
+prepare_env()
+
+PROBE = """
+import json, resource, time
+began = time.perf_counter()
+from admin_server.main import app
+from admin_server.oauth.routes import registration_form
+imported = time.perf_counter()
+registration_form.prepare()
+app.openapi()
+ready = time.perf_counter()
+print(json.dumps({"import": imported - began, "ready": ready - began,
+                  "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                  "properties": len(app.openapi()["components"]["schemas"]["ClientRegistrationRequest"]["properties"])}))
+"""
+
+
+def probe(lang_tags: list[str] | None) -> dict:
+    env = dict(os.environ, INVALIDATION_BACKEND="local")
+    env.pop("LANG_TAGS", None)
+    if lang_tags is not None:
+        env["LANG_TAGS"] = json.dumps(lang_tags)
+    return json.loads(subprocess.check_output([sys.executable, "-c", PROBE], env=env))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tags', nargs='*', default=['en-US', 'ru-RU', 'ja-JP'], help='сокращённый набор')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    for name, lang_tags in (("all tags", None), (f"{len(args.tags)} tags", args.tags)):
+        runs = [probe(lang_tags) for _ in range(args.runs)]
+        print(f"{name:>9}: import {statistics.median(run['import'] for run in runs) * 1000:.0f} ms, "
+              f"ready {statistics.median(run['ready'] for run in runs) * 1000:.0f} ms, "
+              f"max RSS {statistics.median(run['rss'] for run in runs) / 1024:.1f} MiB, "
+              f"{runs[0]['properties']} schema properties")
+
+
+if __name__ == "__main__":
+    main()
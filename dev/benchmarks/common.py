@@ -0,0 +1,64 @@
+# Общие утилиты для бенчмарков. Запуск из корня репозитория:
+#   python -m dev.benchmarks.<name>
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+
+def prepare_env():
+    # Бенчмаркам не нужна БД, но Settings требует заполненные поля
+    os.environ.setdefault("DB_USER", "bench")
+    os.environ.setdefault("DB_PASS", "bench")
+    os.environ.setdefault("DB_HOST", "localhost")
+    os.environ.setdefault("DB_PORT", "5432")
+    os.environ.setdefault("DB_NAME", "bench")
+    os.environ.setdefault("CLIENT_SECRET_KEY", "bench")
+    os.environ.setdefault("CLIENT_ID", "4a07437d-a56c-4789-82ac-5005bd2ab694")
+    if "SECRET_KEY_PATH" not in os.environ:
+        private_path, public_path = generate_key_files("rsa")
+        os.environ["SECRET_KEY_PATH"] = str(private_path)
+        os.environ["PUBLIC_KEY_PATH"] = str(public_path)
+
+
+def generate_key_files(kind: str) -> tuple[Path, Path]:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    match kind:
+        case "rsa":
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        case "ec":
+            private_key = ec.generate_private_key(ec.SECP256R1())
+        case "ed25519":
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        case _:
+            raise ValueError(kind)
+
+    directory = Path(tempfile.mkdtemp(prefix="bench-keys-"))
+    private_path, public_path = directory / "private.pem", directory / "public.pem"
+    private_path.write_bytes(private_key.private_bytes(serialization.Encoding.PEM,
+                                                       serialization.PrivateFormat.PKCS8,
+                                                       serialization.NoEncryption()))
+    public_path.write_bytes(private_key.public_key().public_bytes(serialization.Encoding.PEM,
+                                                                  serialization.PublicFormat.SubjectPublicKeyInfo))
+    return private_path, public_path
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(pct) - 1]
+
+
+def ops_per_sec(func, *args, duration: float = 1.0) -> float:
+    count = 0
+    started = time.perf_counter()
+    deadline = started + duration
+    while time.perf_counter() < deadline:
+        func(*args)
+        count += 1
+    return count / (time.perf_counter() - started)
@@ -0,0 +1,43 @@
+# Интроспекция одного "горячего" токена: проверка подписи на каждый вызов
+# против LRU проверенных токенов.
+#   python -m dev.benchmarks.introspection --requests 20000
+import argparse
+import asyncio
+import time
+
+from .common import prepare_env, percentile
+
+prepare_env()
+
+from admin_server.oauth.introspection import introspect, verified_tokens  # noqa: E402
+from admin_server.utils.security import create_jwt  # noqa: E402
+
+claims = {"client_id": "4a07437d-a56c-4789-82ac-5005bd2ab694", "scope": "openid policies.own.get"}
+
+
+async def measure(token: str, requests: int, cached: bool) -> list[float]:
+    latencies = []
+    for _ in range(requests):
+        if not cached:
+            verified_tokens.clear()
+        started = time.perf_counter()
+        assert (await introspect(token))["active"]
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args()
+
+    token = await create_jwt(claims)
+    for cached in (False, True):
+        latencies = await measure(token, args.requests, cached)
+        print(f"{'cached' if cached else 'verify every time':>17}: "
+              f"p50 {percentile(latencies, 50):.4f} ms, p99 {percentile(latencies, 99):.4f} ms")
+    print(verified_tokens.stats())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+# Задержка доставки событий инвалидации между "воркерами".
+#   python -m dev.benchmarks.invalidation_latency --backend local
+#   python -m dev.benchmarks.invalidation_latency --backend postgres   # нужна БД из admin_server/.env
+# В режиме postgres поднимаются две шины, как в двух процессах uvicorn.
+import argparse
+import asyncio
+import time
+
+from .common import prepare_env, percentile
+
+prepare_env()
+
+from tortoise import Tortoise  # noqa: E402
+
+from admin_server.utils.invalidation import LocalInvalidationBus, PostgresInvalidationBus  # noqa: E402
+from admin_server.utils.settings import TORTOISE_ORM  # noqa: E402
+
+
+async def measure(publisher, subscriber, events: int) -> list[float]:
+    latencies = []
+    received = asyncio.Event()
+    sent_at = 0.0
+
+    def on_event(key):
+        latencies.append((time.perf_counter() - sent_at) * 1000)
+        received.set()
+
+    subscriber.subscribe('clients', on_event)
+    for i in range(events):
+        received.clear()
+        sent_at = time.perf_counter()
+        await publisher.publish('clients', str(i))
+        await asyncio.wait_for(received.wait(), timeout=5)
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--backend', choices=('local', 'postgres'), default='local')
+    parser.add_argument('--events', type=int, default=500)
+    args = parser.parse_args()
+
+    if args.backend == 'local':
+        bus = LocalInvalidationBus()
+        latencies = await measure(bus, bus, args.events)
+    else:
+        await Tortoise.init(config=TORTOISE_ORM)
+        credentials = TORTOISE_ORM['connections']['default']['credentials']
+        worker_a, worker_b = PostgresInvalidationBus(credentials), PostgresInvalidationBus(credentials)
+        await worker_a.start()
+        await worker_b.start()
+        try:
+            latencies = await measure(worker_a, worker_b, args.events)
+        finally:
+            await worker_a.stop()
+            await worker_b.stop()
+            await Tortoise.close_connections()
+
+    print(f"{args.backend}: {len(latencies)} events, "
+          f"p50 {percentile(latencies, 50):.3f} ms, p99 {percentile(latencies, 99):.3f} ms, "
+          f"max {max(latencies):.3f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,42 @@
+# Операции sign/verify в секунду для каждого поддерживаемого типа ключа.
+#   python -m dev.benchmarks.jws_algorithms --duration 1
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from .common import prepare_env, generate_key_files, ops_per_sec
+
+prepare_env()
+
+from admin_server.utils.jws import JoseBackend, CryptographyBackend  # noqa: E402
+from admin_server.utils.keys import KeyMaterial  # noqa: E402
+
+claims = {"client_id": "4a07437d-a56c-4789-82ac-5005bd2ab694", "scope": "openid policies.own.get",
+          "exp": datetime.now(timezone.utc) + timedelta(minutes=30)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--duration', type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"{'alg':<8}{'backend':<14}{'sign/s':>10}{'verify/s':>12}")
+    for kind in ("rsa", "ec", "ed25519"):
+        private_path, public_path = generate_key_files(kind)
+        key = KeyMaterial(private_path.read_text(), public_path.read_text())
+
+        def lookup(kid):
+            return key if kid == key.kid else None
+
+        for backend in (JoseBackend(), CryptographyBackend()):
+            if backend.name == "jose" and key.signing_key is None:
+                print(f"{key.alg:<8}{backend.name:<14}{'n/a':>10}{'n/a':>12}")
+                continue
+            token = backend.sign(claims, key)
+            assert backend.decode(token, lookup)["scope"] == claims["scope"]
+            sign = ops_per_sec(backend.sign, claims, key, duration=args.duration)
+            verify = ops_per_sec(backend.decode, token, lookup, duration=args.duration)
+            print(f"{key.alg:<8}{backend.name:<14}{sign:>10.0f}{verify:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Сверка бэкендов подписи (побайтное совпадение токенов, взаимная проверка)
+# и сравнение пропускной способности sign/verify.
+#   python -m dev.benchmarks.jws_backends --duration 1
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from .common import prepare_env, ops_per_sec
+
+prepare_env()
+
+from jose import JWTError  # noqa: E402
+
+from admin_server.utils.jws import JoseBackend, CryptographyBackend  # noqa: E402
+from admin_server.utils.keys import key_store  # noqa: E402
+
+samples = [
+    {"client_id": "4a07437d-a56c-4789-82ac-5005bd2ab694", "scope": "openid"},
+    {"sub": "user", "scope": "openid policies.all.get policies.set", "nonce": "n-0S6_WzA2Mj", "n": 1, "f": 1.5},
+    {"nested": {"list": [1, 2, 3], "flag": True, "none": None}, "empty": ""},
+]
+
+
+def check_conformance(jose: JoseBackend, fast: CryptographyBackend):
+    key = key_store.signing_key
+    exp = datetime.now(timezone.utc) + timedelta(minutes=5)
+    for claims in samples:
+        claims = dict(claims, exp=exp)
+        jose_token, fast_token = jose.sign(claims, key), fast.sign(claims, key)
+        if key.alg.startswith("RS"):
+            assert jose_token == fast_token, (jose_token, fast_token)
+        assert jose.decode(fast_token, key_store.get_verification_key) == fast.decode(
+                jose_token, key_store.get_verification_key)
+
+    tampered = fast.sign({"sub": "a", "exp": exp}, key)[:-4] + "AAAA"
+    for backend in (jose, fast):
+        try:
+            backend.decode(tampered, key_store.get_verification_key)
+        except JWTError:
+            pass
+        else:
+            raise AssertionError(f"{backend.name} accepted a tampered token")
+
+        expired = backend.sign({"sub": "a", "exp": datetime.now(timezone.utc) - timedelta(seconds=1)}, key)
+        try:
+            backend.decode(expired, key_store.get_verification_key)
+        except JWTError:
+            pass
+        else:
+            raise AssertionError(f"{backend.name} accepted an expired token")
+    print(f"conformance: ok ({key.alg}, {len(samples)} payloads)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--duration', type=float, default=1.0)
+    args = parser.parse_args()
+
+    jose, fast = JoseBackend(), CryptographyBackend()
+    check_conformance(jose, fast)
+
+    key = key_store.signing_key
+    claims = dict(samples[1], exp=datetime.now(timezone.utc) + timedelta(minutes=5))
+    token = fast.sign(claims, key)
+    for backend in (jose, fast):
+        sign = ops_per_sec(backend.sign, claims, key, duration=args.duration)
+        verify = ops_per_sec(backend.decode, token, key_store.get_verification_key, duration=args.duration)
+        print(f"{backend.name:<14} sign: {sign:9.1f}/s  verify: {verify:9.1f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Выпуск RS256 токенов: PEM-строка на каждый вызов (before) против
+# заранее разобранного ключа из KeyStore (after).
+#   python -m dev.benchmarks.jwt_issuance --duration 2
+import argparse
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from .common import prepare_env, ops_per_sec
+
+prepare_env()
+
+from jose import jwt  # noqa: E402
+
+from admin_server.utils.keys import key_store  # noqa: E402
+from admin_server.utils.security import create_jwt, decode_jwt  # noqa: E402
+from admin_server.utils.settings import get_private_key_pem  # noqa: E402
+
+claims = {"client_id": "4a07437d-a56c-4789-82ac-5005bd2ab694", "scope": "openid policies.own.get"}
+
+
+def issue_with_pem():
+    to_encode = dict(claims, exp=datetime.now(timezone.utc) + timedelta(minutes=30))
+    return jwt.encode(to_encode, get_private_key_pem(), algorithm="RS256")
+
+
+def issue_with_key_store():
+    return asyncio.run(create_jwt(claims))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--duration', type=float, default=2.0)
+    args = parser.parse_args()
+
+    token = issue_with_key_store()
+    assert asyncio.run(decode_jwt(token))["client_id"] == claims["client_id"]
+    print(f"kid: {key_store.signing_key.kid}")
+
+    loop = asyncio.new_event_loop()
+
+    def issue_in_loop():
+        return loop.run_until_complete(create_jwt(claims))
+
+    print(f"before (PEM per call):  {ops_per_sec(issue_with_pem, duration=args.duration):8.1f} tokens/s")
+    print(f"after (KeyStore):       {ops_per_sec(issue_in_loop, duration=args.duration):8.1f} tokens/s")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
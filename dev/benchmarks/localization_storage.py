@@ -0,0 +1,173 @@
+# Хранение локализаций клиентов: широкие таблицы (колонка на каждый язык, как было в
+# ClientName/TOSURI/...) против строк clientlocalizations. Размер таблиц, средняя ширина строки
+# и задержка чтения локализаций одного клиента.
+#   python -m dev.benchmarks.localization_storage --clients 2000 --translations 3
+#   python -m dev.benchmarks.localization_storage --db postgres   # нужна БД из admin_server/.env
+import argparse
+import asyncio
+import random
+import time
+import uuid
+
+from .common import prepare_env, percentile
+
+prepare_env()
+
+from tortoise import Tortoise  # noqa: E402
+
+from admin_server.models import Clients, ClientLocalizations  # noqa: E402
+from admin_server.oauth.reg_utils import load_localizations  # noqa: E402
+from admin_server.utils.i18n import lang_tags, localized_fields  # noqa: E402
+from admin_server.utils.settings import TORTOISE_ORM  # noqa: E402
+
+
+def wide_table(field: str) -> str:
+    return f"bench_wide_{field}"
+
+
+def wide_columns(field: str) -> dict[str, str]:
+    """Колонка широкой таблицы -> lang_tag, как в admin_server/migrations/0002_client_localizations.py."""
+    columns = {field: ""}
+    columns.update({f"{field}_{tag.lower().replace('-', '_')}": tag for tag in lang_tags})
+    return columns
+
+
+class Database:
+    def __init__(self, kind: str):
+        self.kind = kind
+
+    @property
+    def conn(self):
+        return Tortoise.get_connection('default')
+
+    def placeholders(self, count: int) -> str:
+        if self.kind == 'sqlite':
+            return ', '.join('?' * count)
+        return ', '.join(f'${i}' for i in range(1, count + 1))
+
+    async def create_wide_tables(self):
+        uuid_type = 'UUID' if self.kind == 'postgres' else 'CHAR(36)'
+        for field in localized_fields:
+            columns = ', '.join(f'"{column}" VARCHAR(255)' for column in wide_columns(field))
+            await self.conn.execute_script(f'DROP TABLE IF EXISTS "{wide_table(field)}"; '
+                                           f'CREATE TABLE "{wide_table(field)}" '
+                                           f'(client_id {uuid_type} PRIMARY KEY, {columns})')
+
+    async def table_bytes(self, table: str) -> int:
+        if self.kind == 'postgres':
+            _, rows = await self.conn.execute_query(f"SELECT pg_total_relation_size('\"{table}\"')")
+            return rows[0][0]
+        # Таблица вместе с её индексами
+        _, rows = await self.conn.execute_query(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name = ? OR name IN "
+                "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ?)", [table, table])
+        return rows[0][0] or 0
+
+    async def row_width(self, table: str, rows: int) -> float:
+        if self.kind == 'postgres':
+            _, result = await self.conn.execute_query(f'SELECT AVG(pg_column_size(t.*)) FROM "{table}" t')
+            return float(result[0][0])
+        return await self.table_bytes(table) / max(rows, 1)
+
+
+def generate(clients: int, translations: int) -> dict[uuid.UUID, dict[tuple[str, str], str]]:
+    """Для каждого клиента все пять полей без языка и translations переводов каждого поля."""
+    tags = list(lang_tags)
+    data = {}
+    for _ in range(clients):
+        values = {}
+        for field in localized_fields:
+            for tag in [""] + random.sample(tags, translations):
+                values[field, tag] = (f"Client {tag}" if field == 'client_name'
+                                      else f"https://client.example.org/{field}/{tag}")
+        data[uuid.uuid4()] = values
+    return data
+
+
+async def fill(db: Database, data: dict):
+    await Clients.bulk_create([Clients(client_id=client_id) for client_id in data], batch_size=1000)
+    await ClientLocalizations.bulk_create([ClientLocalizations(client_id=client_id, field=field, lang_tag=tag,
+                                                               value=value)
+                                           for client_id, values in data.items()
+                                           for (field, tag), value in values.items()], batch_size=1000)
+    for field in localized_fields:
+        columns = {tag: column for column, tag in wide_columns(field).items()}
+        column_list = ', '.join(f'"{column}"' for column in columns.values())
+        sql = (f'INSERT INTO "{wide_table(field)}" (client_id, {column_list}) '
+               f'VALUES ({db.placeholders(len(columns) + 1)})')
+        await db.conn.execute_many(sql, [
+            [client_id if db.kind == 'postgres' else str(client_id)] + [values.get((field, tag)) for tag in columns]
+            for client_id, values in data.items()])
+
+
+async def fetch_wide(db: Database, client_id: uuid.UUID) -> dict:
+    # Как раньше: по SELECT * на каждую из пяти таблиц
+    key = client_id if db.kind == 'postgres' else str(client_id)
+    result = {}
+    for field in localized_fields:
+        rows = await db.conn.execute_query_dict(
+                f'SELECT * FROM "{wide_table(field)}" WHERE client_id = {db.placeholders(1)}', [key])
+        for column, tag in wide_columns(field).items():
+            if rows and (value := rows[0][column]) is not None:
+                result[f"{field}#{tag}" if tag else field] = value
+    return result
+
+
+async def measure(fetch, client_ids: list, count: int) -> list[float]:
+    latencies = []
+    for client_id in random.choices(client_ids, k=count):
+        began = time.perf_counter()
+        await fetch(client_id)
+        latencies.append((time.perf_counter() - began) * 1000)
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--db', choices=('sqlite', 'postgres'), default='sqlite')
+    parser.add_argument('--clients', type=int, default=2000)
+    parser.add_argument('--translations', type=int, default=3, help='переводов на каждое поле')
+    parser.add_argument('--fetches', type=int, default=2000)
+    args = parser.parse_args()
+
+    random.seed(1)
+    db = Database(args.db)
+    if args.db == 'sqlite':
+        await Tortoise.init(db_url='sqlite://:memory:', modules={'main': ['admin_server.models']})
+    else:
+        await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        await Tortoise.generate_schemas(safe=True)
+        await db.create_wide_tables()
+        data = generate(args.clients, args.translations)
+        await fill(db, data)
+
+        client_ids = list(data)
+        expected = {client_id: {(f"{field}#{tag}" if tag else field): value for (field, tag), value in values.items()}
+                    for client_id, values in data.items()}
+        sample = client_ids[0]
+        assert await fetch_wide(db, sample) == expected[sample]
+        assert (await load_localizations([sample]))[sample] == expected[sample]
+
+        wide_rows = len(data)
+        wide_bytes = sum([await db.table_bytes(wide_table(field)) for field in localized_fields])
+        wide_width = sum([await db.row_width(wide_table(field), wide_rows) for field in localized_fields]) / 5
+        sparse_rows = sum(len(values) for values in data.values())
+        sparse_bytes = await db.table_bytes('clientlocalizations')
+        sparse_width = await db.row_width('clientlocalizations', sparse_rows)
+
+        wide_latency = await measure(lambda client_id: fetch_wide(db, client_id), client_ids, args.fetches)
+        sparse_latency = await measure(lambda client_id: load_localizations([client_id]), client_ids, args.fetches)
+
+        print(f"{args.clients} clients, {args.translations} translations per field ({args.db})")
+        print(f"wide:   5 tables x {wide_rows} rows, {wide_bytes / 2 ** 20:.2f} MiB, "
+              f"{wide_width:.0f} B per row, {len(wide_columns('client_name'))} columns per table, "
+              f"fetch p50 {percentile(wide_latency, 50):.3f} ms, p99 {percentile(wide_latency, 99):.3f} ms")
+        print(f"sparse: {sparse_rows} rows, {sparse_bytes / 2 ** 20:.2f} MiB, {sparse_width:.0f} B per row, "
+              f"fetch p50 {percentile(sparse_latency, 50):.3f} ms, p99 {percentile(sparse_latency, 99):.3f} ms")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
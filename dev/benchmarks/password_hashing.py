@@ -0,0 +1,103 @@
+# Пропускная способность логинов и p99 задержки "соседнего" эндпоинта
+# при синхронном bcrypt в обработчике (before) и при пуле хешера (after).
+#   python -m dev.benchmarks.password_hashing --logins 40 --concurrency 8
+import argparse
+import asyncio
+import time
+
+from .common import prepare_env, percentile
+
+prepare_env()
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import ORJSONResponse  # noqa: E402
+
+from admin_server.exceptions import PasswordHasherOverloadedError  # noqa: E402
+from admin_server.utils.security import (pwd_context, verify_password, password_hasher,  # noqa: E402
+                                         _get_password_hash_sync)
+
+
+def build_app(offloaded: bool, hashed: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.post('/login')
+    async def login():
+        if offloaded:
+            try:
+                ok = await verify_password("password", hashed)
+            except PasswordHasherOverloadedError:
+                return ORJSONResponse(status_code=503, content={})
+        else:
+            ok = pwd_context.verify("password", hashed)
+        return {'ok': ok}
+
+    @app.get('/ping')
+    async def ping():
+        return {'ok': True}
+
+    return app
+
+
+async def run(app: FastAPI, logins: int, concurrency: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        queue = asyncio.Queue()
+        for _ in range(logins):
+            queue.put_nowait(None)
+        statuses = []
+        ping_latencies = []
+        done = asyncio.Event()
+
+        async def login_worker():
+            while not queue.empty():
+                queue.get_nowait()
+                statuses.append((await client.post('/login')).status_code)
+
+        async def pinger():
+            # Пинги идут по фиксированному расписанию; пропущенные из-за
+            # заблокированного event loop слоты тоже учитываются в задержке
+            interval = 0.005
+            scheduled = time.perf_counter()
+            while True:
+                await client.get('/ping')
+                now = time.perf_counter()
+                while scheduled <= now:
+                    ping_latencies.append((now - scheduled) * 1000)
+                    scheduled += interval
+                if done.is_set():
+                    break
+                await asyncio.sleep(scheduled - now)
+
+        ping_task = asyncio.create_task(pinger())
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await ping_task
+
+    return {
+        'logins/s': round(statuses.count(200) / elapsed, 1),
+        'rejected (503)': statuses.count(503),
+        'ping samples': len(ping_latencies),
+        'ping p50, ms': round(percentile(ping_latencies, 50), 2),
+        'ping p99, ms': round(percentile(ping_latencies, 99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--logins', type=int, default=40)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    hashed = _get_password_hash_sync("password")
+    for name, offloaded in (('before (sync bcrypt)', False), ('after (hasher pool)', True)):
+        result = asyncio.run(run(build_app(offloaded, hashed), args.logins, args.concurrency))
+        print(f'{name:<22}', '  '.join(f'{k}: {v}' for k, v in result.items()))
+    password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Проверенные запросы в секунду к эндпоинту policies_server с локальной проверкой JWT.
+# JWKS отдаёт подставной HTTP-сервер на 127.0.0.1; после старта к нему не должно быть обращений.
+#   python -m dev.benchmarks.policies_verification --requests 5000 --key ec
+import argparse
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Annotated
+
+from .common import prepare_env, generate_key_files, percentile
+
+prepare_env()
+
+import httpx  # noqa: E402
+import orjson  # noqa: E402
+from fastapi import FastAPI, Security  # noqa: E402
+
+from admin_server.utils.jws import CryptographyBackend  # noqa: E402
+from admin_server.utils.keys import KeyMaterial  # noqa: E402
+
+
+class StandInJWKSServer:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.hits = 0
+        self._server: asyncio.Server | None = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.readuntil(b"\r\n\r\n")
+        self.hits += 1
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nConnection: close\r\n"
+                     b"Content-Length: " + str(len(self.body)).encode() + b"\r\n\r\n" + self.body)
+        await writer.drain()
+        writer.close()
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--key', choices=('rsa', 'ec', 'ed25519'), default='rsa')
+    args = parser.parse_args()
+
+    private_path, public_path = generate_key_files(args.key)
+    key = KeyMaterial(private_path.read_text(), public_path.read_text())
+    jwks_server = StandInJWKSServer(orjson.dumps({"keys": [key.public_jwk]}))
+    port = await jwks_server.start()
+
+    # Адрес задаётся до импорта policies_server: jwks_cache создаётся при импорте
+    os.environ["AUTH_SERVER_ADDRESS"] = f"http://127.0.0.1:{port}"
+    from policies_server.schemas import OwnerSchema
+    from policies_server.security import get_resourse_owner, jwks_cache
+
+    app = FastAPI()
+
+    @app.get('/policy')
+    async def policy(owner: Annotated[OwnerSchema, Security(get_resourse_owner, scopes=["policies.own.get"])]):
+        return {'client_id': owner.client_id}
+
+    claims = {"iss": f"http://127.0.0.1:{port}", "client_id": "4a07437d-a56c-4789-82ac-5005bd2ab694",
+              "scope": "openid policies.own.get", "exp": datetime.now(timezone.utc) + timedelta(minutes=30)}
+    token = CryptographyBackend().sign(claims, key)
+    rejected = [CryptographyBackend().sign(claims | changed, key)
+                for changed in ({"iss": "http://elsewhere"}, {"client_id": "not-a-uuid"}, {"client_id": None})]
+    await jwks_cache.start()
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://policies") as client:
+            headers = {"Authorization": f"Bearer {token}"}
+            assert (await client.get('/policy', headers=headers)).status_code == 200
+            assert (await client.get('/policy', headers={"Authorization": "Bearer x.y.z"})).status_code == 401
+            for bad_token in rejected:
+                assert (await client.get('/policy', headers={"Authorization": f"Bearer {bad_token}"})).status_code == 401
+
+            latencies = []
+            started = time.perf_counter()
+            for _ in range(args.requests):
+                began = time.perf_counter()
+                response = await client.get('/policy', headers=headers)
+                latencies.append((time.perf_counter() - began) * 1000)
+                assert response.status_code == 200
+            elapsed = time.perf_counter() - started
+    finally:
+        await jwks_cache.stop()
+        await jwks_server.stop()
+
+    print(f"{key.alg}: {args.requests / elapsed:.0f} verified requests/s, "
+          f"p50 {percentile(latencies, 50):.3f} ms, p99 {percentile(latencies, 99):.3f} ms")
+    print(f"JWKS fetches during the run: {jwks_server.hits}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
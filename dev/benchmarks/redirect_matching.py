@@ -0,0 +1,101 @@
+# Проверка redirect_uri для клиентов с сотнями зарегистрированных URI: RedirectMatcher
+# против перебора с нормализацией на каждый запрос. Сначала сверяется корректность.
+#   python -m dev.benchmarks.redirect_matching --uris 500 --checks 200000
+import argparse
+import random
+import time
+
+from .common import prepare_env
+
+prepare_env()
+
+from admin_server.oauth.redirects import RedirectMatcher, normalize_redirect_uri  # noqa: E402
+
+
+def registered_uris(count: int) -> list[str]:
+    uris = [f"https://app{i % 20}.example.org/callback/{i}?tenant={i}" for i in range(count - 4)]
+    return uris + ["http://127.0.0.1/native", "http://[::1]/native", "HTTPS://Upper.Example.org:443", "https://x.org:8443/cb"]
+
+
+def linear_match(uris: list[str], uri: str) -> bool:
+    if not (incoming := normalize_redirect_uri.__wrapped__(uri)):
+        return False
+    for registered in uris:
+        candidate = normalize_redirect_uri.__wrapped__(registered)
+        if incoming.is_loopback and candidate.is_loopback:
+            if (incoming.host, incoming.path) == (candidate.host, candidate.path):
+                return True
+        elif incoming == candidate:
+            return True
+    return False
+
+
+def check_correctness(matcher: RedirectMatcher, uris: list[str]):
+    expected = {
+        "https://app3.example.org/callback/3?tenant=3": True,
+        "https://APP3.example.org:443/callback/3?tenant=3": True,
+        "https://app3.example.org/callback/3?tenant=4": False,
+        "https://app3.example.org/Callback/3?tenant=3": False,
+        "https://app3.example.org/callback/3?tenant=3#frag": False,
+        "https://upper.example.org/": True,
+        "https://x.org:8443/cb": True,
+        "https://x.org/cb": False,
+        "http://127.0.0.1:49152/native": True,
+        "http://127.0.0.1/native": True,
+        "http://[::1]:8080/native": True,
+        "http://127.0.0.1:49152/other": False,
+        "http://localhost:49152/native": False,
+        "https://127.0.0.1:49152/native": False,
+        "https://evil.example.org/callback/3?tenant=3": False,
+    }
+    for uri, result in expected.items():
+        assert matcher.matches(uri) is result, uri
+        assert linear_match(uris, uri) is result, uri
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--uris', type=int, default=500, help='зарегистрированных URI у клиента')
+    parser.add_argument('--checks', type=int, default=200_000)
+    args = parser.parse_args()
+
+    random.seed(1)
+    uris = registered_uris(args.uris)
+    began = time.perf_counter()
+    matcher = RedirectMatcher.from_uris(uris)
+    build_time = time.perf_counter() - began
+    check_correctness(matcher, uris)
+    print(f"{len(matcher)} registered URIs, matcher built in {build_time * 1000:.2f} ms, correctness ok")
+
+    # Половина — совпадения, половина — чужие URI; loopback с новым портом каждый раз
+    incoming = []
+    for i in range(args.checks):
+        match i % 4:
+            case 0:
+                incoming.append(random.choice(uris))
+            case 1:
+                incoming.append(f"http://127.0.0.1:{random.randint(1024, 65535)}/native")
+            case 2:
+                incoming.append(f"https://app1.example.org/callback/{random.randint(0, 10 ** 6)}")
+            case _:
+                incoming.append(f"https://evil{i}.example.org/cb")
+
+    normalize_redirect_uri.cache_clear()
+    began = time.perf_counter()
+    matched = sum(matcher.matches(uri) for uri in incoming)
+    matcher_time = time.perf_counter() - began
+
+    sample = incoming[:max(1, args.checks // 100)]
+    began = time.perf_counter()
+    for uri in sample:
+        linear_match(uris, uri)
+    linear_time = (time.perf_counter() - began) / len(sample) * args.checks
+
+    print(f"matcher: {args.checks / matcher_time:,.0f} checks/s ({matched} matched), "
+          f"{matcher_time / args.checks * 1e6:.2f} us per check")
+    print(f"linear scan (extrapolated from {len(sample)} checks): {args.checks / linear_time:,.0f} checks/s, "
+          f"{linear_time / args.checks * 1e6:.2f} us per check")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Схема запроса регистрации: локализации через extra-поля и один валидатор против прежней
+# сгенерированной модели (по полю на каждый язык, ~775 полей; здесь собирается через create_model).
+# Время импорта admin_server.schemas, построения модели, её память и время валидации.
+#   python -m dev.benchmarks.registration_schema --validations 2000
+import argparse
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .common import prepare_env, percentile
+
+prepare_env()
+
+from pydantic import ConfigDict, Field, create_model  # noqa: E402
+
+from admin_server.schemas import ClientRegistrationRequest, HttpsUrl  # noqa: E402
+from admin_server.utils.i18n import lang_tags, localized_fields  # noqa: E402
+
+
+def build_legacy_model():
+    class LegacyBase(ClientRegistrationRequest):
+        model_config = ConfigDict(extra='ignore')
+
+    definitions = {}
+    for field, title in localized_fields.items():
+        annotation = HttpsUrl | None if field.endswith('_uri') else str | None
+        for lang_tag, language in lang_tags.items():
+            name = f"{field}_{lang_tag.lower().replace('-', '_')}"
+            definitions[name] = (annotation, Field(alias=f"{field}#{lang_tag}", title=f"{title} ({language})",
+                                                   default=None))
+    return create_model('LegacyClientRegistrationRequest', __base__=LegacyBase, **definitions)
+
+
+def import_time() -> float:
+    # Отдельный процесс: замеряется холодный импорт модуля со всеми зависимостями
+    code = ("import time; began = time.perf_counter(); import admin_server.schemas; "
+            "print(time.perf_counter() - began)")
+    return float(subprocess.check_output([sys.executable, '-c', code]).decode())
+
+
+def requests() -> dict[str, dict]:
+    minimal = {"redirect_uris": ["https://client.example.org/callback"],
+               "grant_types": ["authorization_code"],
+               "software_statement": "bench"}
+    localized = {**minimal, "client_name": "Client", "logo_uri": "https://client.example.org/logo.png",
+                 "client_name#ja-JP": "クライアント名", "client_name#de-DE": "Kunde",
+                 "logo_uri#fr-FR": "https://client.example.org/fr/logo.png"}
+    everything = dict(minimal)
+    for field in localized_fields:
+        for lang_tag in lang_tags:
+            everything[f"{field}#{lang_tag}"] = (f"https://client.example.org/{lang_tag}" if field.endswith('_uri')
+                                                 else f"Client ({lang_tag})")
+    return {"minimal": minimal, "5 translations": localized, "all translations": everything}
+
+
+def validation_time(model, body: dict, count: int) -> list[float]:
+    latencies = []
+    for _ in range(count):
+        began = time.perf_counter()
+        model.model_validate(body)
+        latencies.append((time.perf_counter() - began) * 1e6)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--validations', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"import admin_server.schemas: {import_time() * 1000:.0f} ms")
+
+    tracemalloc.start()
+    began = time.perf_counter()
+    legacy = build_legacy_model()
+    build_time = time.perf_counter() - began
+    legacy_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"legacy model: {len(legacy.model_fields)} fields, built in {build_time * 1000:.0f} ms, "
+          f"{legacy_memory / 2 ** 20:.1f} MiB; current model: {len(ClientRegistrationRequest.model_fields)} fields")
+
+    for name, body in requests().items():
+        current = ClientRegistrationRequest.model_validate(body).model_dump(by_alias=True, exclude_unset=True)
+        assert current == legacy.model_validate(body).model_dump(by_alias=True, exclude_unset=True), name
+        for label, model in (("legacy", legacy), ("current", ClientRegistrationRequest)):
+            latencies = validation_time(model, body, args.validations)
+            print(f"{name:>16} {label:>7}: p50 {percentile(latencies, 50):.1f} us, "
+                  f"p99 {percentile(latencies, 99):.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Колесо таймеров с миллионом отложенных дедлайнов: память, вставка/отмена и цена тика.
+#   python -m dev.benchmarks.timing_wheel --deadlines 1000000 --horizon 3600
+# Время моделируется (advance(now)), поэтому прогон не ждёт реальных секунд.
+import argparse
+import random
+import time
+import tracemalloc
+
+from .common import percentile
+
+from admin_server.utils.timing_wheel import TimingWheel  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--deadlines', type=int, default=1_000_000)
+    parser.add_argument('--horizon', type=float, default=3600.0, help='дедлайны равномерно в пределах N секунд')
+    parser.add_argument('--ticks', type=int, default=600)
+    parser.add_argument('--cancel-share', type=float, default=0.1)
+    args = parser.parse_args()
+
+    random.seed(1)
+    wheel = TimingWheel()
+    expired = 0
+
+    def on_expiry(keys):
+        nonlocal expired
+        expired += len(keys)
+
+    wheel.register('bench', on_expiry)
+    start = time.time()
+    deadlines = [start + random.uniform(1, args.horizon) for _ in range(args.deadlines)]
+
+    # Память меряем на отдельном колесе: tracemalloc сильно замедляет вставку
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    probe = TimingWheel()
+    for i, deadline in enumerate(deadlines):
+        probe.schedule('bench', i, deadline)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del probe
+
+    began = time.perf_counter()
+    timers = [wheel.schedule('bench', i, deadline) for i, deadline in enumerate(deadlines)]
+    schedule_time = time.perf_counter() - began
+
+    to_cancel = random.sample(timers, int(len(timers) * args.cancel_share))
+    began = time.perf_counter()
+    for timer in to_cancel:
+        wheel.cancel(timer)
+    cancel_time = time.perf_counter() - began
+
+    print(f"{args.deadlines} deadlines over {args.horizon:.0f}s")
+    print(f"memory: {held / 2 ** 20:.1f} MiB, {held / args.deadlines:.0f} B per deadline")
+    print(f"schedule: {args.deadlines / schedule_time:,.0f} ops/s, "
+          f"cancel: {len(to_cancel) / cancel_time:,.0f} ops/s" if to_cancel else "")
+
+    tick_costs = []
+    for tick in range(1, args.ticks + 1):
+        began = time.perf_counter()
+        wheel.advance(start + tick)
+        tick_costs.append((time.perf_counter() - began) * 1000)
+    print(f"{args.ticks} ticks, {expired} expired ({expired / args.ticks:.0f} per tick): "
+          f"p50 {percentile(tick_costs, 50):.3f} ms, p99 {percentile(tick_costs, 99):.3f} ms, "
+          f"max {max(tick_costs):.3f} ms (max includes cascades of upper levels)")
+    print(f"outstanding: {len(wheel)}")
+
+
+if __name__ == "__main__":
+    main()
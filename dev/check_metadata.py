@@ -0,0 +1,61 @@
+# Проверка discovery-документов через HTTP: собирает документы admin_server так же, как при старте,
+# забирает /.well-known/* и убеждается, что каждый объявленный эндпоинт действительно отвечает
+# (не 404/405), JWKS содержит ключ, которым подписываются токены, ETag даёт 304.
+# Код выхода 1 при расхождениях — для CI.
+#   python -m dev.check_metadata
+import asyncio
+import sys
+
+from dev.benchmarks.common import prepare_env
+
+prepare_env()
+
+import httpx  # noqa: E402
+
+from admin_server.main import app  # noqa: E402
+from admin_server.utils.keys import key_store  # noqa: E402
+from admin_server.well_known.metadata import document_routes, endpoint_routes, metadata_documents  # noqa: E402
+
+
+async def check(client: httpx.AsyncClient) -> list[str]:
+    problems = []
+    documents = {}
+    for name in document_routes:
+        response = await client.get(f'/.well-known/{name}')
+        if response.status_code != 200:
+            problems.append(f"{name}: HTTP {response.status_code}")
+            continue
+        documents[name] = response.json()
+        cached = await client.get(f'/.well-known/{name}', headers={'If-None-Match': response.headers['ETag']})
+        if cached.status_code != 304:
+            problems.append(f"{name}: If-None-Match gave HTTP {cached.status_code}, expected 304")
+
+    metadata = documents.get('oauth-authorization-server', {})
+    for field, (method, _) in endpoint_routes.items():
+        if not (url := metadata.get(field)):
+            problems.append(f"{field}: missing")
+            continue
+        # Пустой запрос: эндпоинт должен существовать, ответ по сути (400/401/422) не важен
+        response = await client.request(method, httpx.URL(url).path)
+        if response.status_code in (404, 405):
+            problems.append(f"{field}: {method} {url} -> HTTP {response.status_code}")
+
+    jwks = (await client.get(httpx.URL(metadata.get('jwks_uri', '/')).path)).json()
+    if not any(key.get('kid') == key_store.signing_key.kid for key in jwks.get('keys', [])):
+        problems.append(f"jwks_uri has no signing key {key_store.signing_key.kid}")
+    return problems
+
+
+async def main():
+    # БД не нужна: пустые запросы к эндпоинтам отбиваются валидацией до обращения к ней
+    metadata_documents.build(app)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://auth") as client:
+        problems = await check(client)
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    print("metadata OK" if not problems else f"{len(problems)} problem(s)")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,44 @@
+# Применение миграций схемы (admin_server/migrations, policies_server/migrations, см. schema_migrations)
+# к базе из настроек сервиса.
+#   python -m dev.migrate admin_server policies_server
+#   python -m dev.migrate admin_server --status
+#   python -m dev.migrate admin_server --to 2
+import argparse
+import asyncio
+import importlib
+
+from tortoise import Tortoise
+
+services = {
+    'admin_server': 'admin_server.utils.settings',
+    'policies_server': 'policies_server.settings',
+}
+
+
+async def migrate(service: str, target: int | None, status: bool):
+    migrations = importlib.import_module(f"{service}.migrations").migrations
+    if not status:
+        await migrations.upgrade(target)
+        return
+    for path, applied in (await migrations.status()).items():
+        print(f"{service}: {'applied' if applied else 'pending'} {path.name}")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('services', nargs='+', choices=services)
+    parser.add_argument('--to', type=int, help='применить миграции только до этой версии включительно')
+    parser.add_argument('--status', action='store_true', help='показать применённые и ожидающие миграции')
+    args = parser.parse_args()
+
+    # У сервисов разные настройки и, возможно, разные базы: по инициализации Tortoise на каждый
+    for service in args.services:
+        await Tortoise.init(config=importlib.import_module(services[service]).TORTOISE_ORM)
+        try:
+            await migrate(service, args.to, args.status)
+        finally:
+            await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
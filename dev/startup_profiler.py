@@ -0,0 +1,224 @@
+# Профиль холодного старта сервисов: время импорта каждого модуля (-X importtime), загрузка
+# настроек, register_tortoise / Tortoise.init / generate_schemas, шаблоны и статика, каждый
+# startup-обработчик. С --budget код выхода 1, если старт какого-либо сервиса дольше бюджета —
+# для проверки регрессий в CI.
+#   python -m dev.startup_profiler admin_server
+#   python -m dev.startup_profiler policies_server.main:app --sqlite
+#   python -m dev.startup_profiler --all --sqlite --budget 5
+# --sqlite подменяет БД из конфигурации на sqlite в памяти (без Postgres): схема тогда создаётся
+# generate_schemas, а проверка версии миграций пропускается. Для admin_server без Postgres нужен
+# ещё INVALIDATION_BACKEND=local.
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+services = {
+    'admin_server': 'admin_server.main:app',
+    'policies_server': 'policies_server.main:app',
+    'admin_client': 'admin_client.main:app',
+}
+
+MARKER = 'STARTUP_PROFILE '
+
+
+class Recorder:
+    def __init__(self):
+        self.phases: dict[str, float] = defaultdict(float)
+        self.handlers: list[tuple[str, float]] = []
+
+    def wrap(self, owner, attr: str, label: str, replace=None):
+        """Подменяет owner.attr обёрткой, которая суммирует время вызовов в phases[label]."""
+        original = getattr(owner, attr)
+        recorder = self
+
+        if inspect.iscoroutinefunction(original):
+            async def timed(*args, **kwargs):
+                began = time.perf_counter()
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    recorder.phases[label] += time.perf_counter() - began
+        else:
+            def timed(*args, **kwargs):
+                if replace:
+                    args, kwargs = replace(args, kwargs)
+                began = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    recorder.phases[label] += time.perf_counter() - began
+
+        setattr(owner, attr, timed)
+
+    def wrap_handler(self, handler):
+        func = getattr(handler, 'func', handler)
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        async def timed():
+            began = time.perf_counter()
+            try:
+                if inspect.iscoroutinefunction(func):
+                    await handler()
+                else:
+                    handler()
+            finally:
+                self.handlers.append((name, time.perf_counter() - began))
+
+        return timed
+
+
+def _sqlite_config(args: tuple, kwargs: dict) -> tuple[tuple, dict]:
+    # register_tortoise(app, config, ...): оставляем приложения с моделями, меняем только соединение;
+    # миграции написаны для Postgres, поэтому схему в sqlite создаёт generate_schemas
+    kwargs = dict(kwargs)
+    config = kwargs.pop('config', None) or (args[1] if len(args) > 1 else None)
+    config = {'connections': {'default': 'sqlite://:memory:'}, 'apps': config['apps']}
+    kwargs['generate_schemas'] = True
+    return (args[0], config), kwargs
+
+
+def probe(target: str, sqlite: bool):
+    """Выполняется в дочернем процессе, запущенном с -X importtime."""
+    recorder = Recorder()
+    started = time.perf_counter()
+
+    import pydantic_settings
+    import tortoise.contrib.fastapi
+    from fastapi.staticfiles import StaticFiles
+    from fastapi.templating import Jinja2Templates
+    from tortoise import Tortoise
+    libraries_ready = time.perf_counter()
+
+    recorder.wrap(pydantic_settings.BaseSettings, '__init__', 'settings load')
+    recorder.wrap(Jinja2Templates, '__init__', 'templates setup')
+    recorder.wrap(StaticFiles, '__init__', 'static files setup')
+    recorder.wrap(tortoise.contrib.fastapi, 'register_tortoise', 'register_tortoise',
+                  replace=_sqlite_config if sqlite else None)
+    recorder.wrap(Tortoise, 'init', 'Tortoise.init')
+    recorder.wrap(Tortoise, 'generate_schemas', 'generate_schemas')
+
+    module_name, _, attr = target.partition(':')
+    app = getattr(importlib.import_module(module_name), attr or 'app')
+    imported = time.perf_counter()
+
+    app.router.on_startup = [recorder.wrap_handler(handler) for handler in app.router.on_startup
+                             if not (sqlite and getattr(handler, '__name__', '') == 'check_schema_version')]
+    error = None
+    try:
+        asyncio.run(_run_startup(app))
+    except Exception as e:  # отчёт нужен и при падении старта
+        error = f"{type(e).__name__}: {e}"
+    finished = time.perf_counter()
+
+    print(MARKER + json.dumps({
+        'libraries': libraries_ready - started,
+        'import': imported - libraries_ready,
+        'startup': finished - imported,
+        'total': finished - started,
+        'phases': recorder.phases,
+        'handlers': recorder.handlers,
+        'error': error,
+    }), flush=True)
+
+
+async def _run_startup(app):
+    await app.router.startup()
+    await app.router.shutdown()
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """(модуль, собственное время, суммарное время) в микросекундах."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix('import time:').split('|')
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def profile(target: str, sqlite: bool) -> dict:
+    command = [sys.executable, '-X', 'importtime', '-m', 'dev.startup_profiler', '--probe', target]
+    if sqlite:
+        command.append('--sqlite')
+    result = subprocess.run(command, capture_output=True, text=True, env=dict(os.environ))
+    for line in result.stdout.splitlines():
+        if line.startswith(MARKER):
+            report = json.loads(line.removeprefix(MARKER))
+            break
+    else:
+        raise RuntimeError(f"{target} failed to start:\n{result.stderr[-3000:]}")
+    report['modules'] = parse_importtime(result.stderr)
+    return report
+
+
+def print_report(target: str, report: dict, top: int):
+    print(f"== {target}: cold start {report['total'] * 1000:.0f} ms "
+          f"(framework imports {report['libraries'] * 1000:.0f} ms, app import {report['import'] * 1000:.0f} ms, "
+          f"startup {report['startup'] * 1000:.0f} ms)")
+    if report['error']:
+        print(f"   startup failed: {report['error']}")
+
+    print("   phases:")
+    for name, seconds in sorted(report['phases'].items(), key=lambda item: -item[1]):
+        print(f"     {seconds * 1000:9.1f} ms  {name}")
+    print("   startup handlers:")
+    for name, seconds in sorted(report['handlers'], key=lambda item: -item[1]):
+        print(f"     {seconds * 1000:9.1f} ms  {name}")
+
+    packages = defaultdict(int)
+    for name, self_us, _ in report['modules']:
+        packages[name.split('.')[0]] += self_us
+    print(f"   imports by top-level package (self time, top {top}):")
+    for name, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"     {self_us / 1000:9.1f} ms  {name}")
+    print(f"   slowest modules (self time, top {top}):")
+    for name, self_us, cumulative_us in sorted(report['modules'], key=lambda item: -item[1])[:top]:
+        print(f"     {self_us / 1000:9.1f} ms  {name} (cumulative {cumulative_us / 1000:.1f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('targets', nargs='*', help='module:app или имя сервиса: ' + ', '.join(services))
+    parser.add_argument('--all', action='store_true', help='все три сервиса')
+    parser.add_argument('--sqlite', action='store_true', help='sqlite в памяти вместо БД из настроек')
+    parser.add_argument('--budget', type=float, help='допустимый холодный старт, секунды')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--json', action='store_true', help='вывести отчёты как JSON')
+    parser.add_argument('--probe', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe:
+        probe(args.targets[0], args.sqlite)
+        return
+
+    targets = [services.get(target, target) for target in (list(services) if args.all else args.targets)]
+    if not targets:
+        parser.error('specify a service or --all')
+
+    reports = {target: profile(target, args.sqlite) for target in targets}
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        for target, report in reports.items():
+            print_report(target, report, args.top)
+
+    failed = [target for target, report in reports.items() if report['error']]
+    over_budget = [target for target, report in reports.items()
+                   if args.budget is not None and report['total'] > args.budget]
+    for target in over_budget:
+        print(f"FAIL: {target} cold start {reports[target]['total']:.2f} s exceeds budget {args.budget:.2f} s")
+    for target in failed:
+        print(f"FAIL: {target} startup raised {reports[target]['error']}")
+    sys.exit(1 if over_budget or failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,19 +8,21 @@ from pydantic import UUID4
 from tortoise.contrib.fastapi import register_tortoise
 from tortoise.transactions import in_transaction
 
+from .migrations import check_schema_version
 from .models import PolicyModel, PolicyCategoryModel
 from .schemas import PolicySchema, OwnerSchema
+from .security import get_resourse_owner, jwks_cache
 from .settings import TORTOISE_ORM
 
 app = FastAPI()
-register_tortoise(app, TORTOISE_ORM, generate_schemas=True)
+app.add_event_handler("startup", jwks_cache.start)
+app.add_event_handler("shutdown", jwks_cache.stop)
+# Схему создают миграции (python -m dev.migrate policies_server), воркер только сверяет версию
+register_tortoise(app, TORTOISE_ORM, generate_schemas=False)
+app.add_event_handler("startup", check_schema_version)
 policies_path = OSPath(__file__).parent / 'policies'
 
 
-async def get_resourse_owner():
-    pass
-
-
 @app.get('/all_policies')
 async def get_all_policies(owner: Annotated[OwnerSchema, Security(get_resourse_owner, scopes=["policies.all.get"])]):
     async with in_transaction() as conn:
@@ -0,0 +1,12 @@
+-- Схема, которую до перехода на миграции создавал generate_schemas.
+CREATE TABLE IF NOT EXISTS "policycategorymodel" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "name" VARCHAR(255) NOT NULL,
+    "server_id" UUID NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "policymodel" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "name" VARCHAR(255) NOT NULL,
+    "allowed_values" text[] NOT NULL,
+    "category_id" UUID NOT NULL REFERENCES "policycategorymodel" ("id") ON DELETE CASCADE
+);
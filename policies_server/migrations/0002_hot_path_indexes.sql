@@ -0,0 +1,3 @@
+-- /{server_id}/all_policies фильтрует категории по server_id, prefetch политик идёт по category_id
+CREATE INDEX IF NOT EXISTS "idx_policycateg_server__40d479" ON "policycategorymodel" ("server_id");
+CREATE INDEX IF NOT EXISTS "idx_policymodel_categor_53a690" ON "policymodel" ("category_id");
@@ -0,0 +1,8 @@
+# Миграции схемы policies_server: NNNN_name.sql или NNNN_name.py с async def upgrade(conn), см. schema_migrations.
+# Применяются python -m dev.migrate policies_server, воркер при старте только сверяет версию.
+from pathlib import Path
+
+from schema_migrations import Migrations
+
+migrations = Migrations('policies_server', Path(__file__).parent)
+check_schema_version = migrations.check_schema_version
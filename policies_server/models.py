@@ -5,7 +5,7 @@ from tortoise.contrib.postgres.fields import ArrayField
 class PolicyCategoryModel(Model):
     id = fields.UUIDField(pk=True)
     name = fields.CharField(max_length=255)
-    server_id = fields.UUIDField(null=False)
+    server_id = fields.UUIDField(null=False, index=True)
 
     policies: fields.ReverseRelation["PolicyModel"]
 
@@ -23,7 +23,7 @@ class PolicyModel(Model):
     allowed_values = ArrayField(element_type="text")
 
     category: fields.ForeignKeyRelation[PolicyCategoryModel] = fields.ForeignKeyField('main.PolicyCategoryModel',
-                                                                                      'policies')
+                                                                                      'policies', index=True)
 
     async def to_dict(self):
         return {
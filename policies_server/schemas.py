@@ -22,4 +22,6 @@ class PolicySchema(BaseModel):
 
 
 class OwnerSchema(BaseModel):
-    pass
+    sub: UUID4 | None = None
+    client_id: UUID4
+    scope: str = ""
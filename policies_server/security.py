@@ -0,0 +1,261 @@
+import asyncio
+import base64
+import binascii
+import logging
+import time
+from functools import lru_cache
+from typing import Annotated, NamedTuple
+
+import httpx
+import orjson
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer, SecurityScopes
+from pydantic import ValidationError
+
+from .schemas import OwnerSchema
+from .settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_hash_algs = {
+    "256": hashes.SHA256,
+    "384": hashes.SHA384,
+    "512": hashes.SHA512,
+}
+
+_curves = {
+    "P-256": ec.SECP256R1,
+    "P-384": ec.SECP384R1,
+    "P-521": ec.SECP521R1,
+}
+
+
+# Scope, которые проверяет этот сервис; у каждого свой бит
+policy_scopes = ("openid", "policies.all.get", "policies.own.get", "policies.set")
+_scope_bits = {name: 1 << position for position, name in enumerate(policy_scopes)}
+
+
+@lru_cache(maxsize=1024)
+def granted_scope_mask(scope: str) -> int:
+    # Чужие для сервиса scope в токене просто не дают прав
+    names = set(scope.split())
+    return sum(bit for name, bit in _scope_bits.items() if name in names)
+
+
+@lru_cache(maxsize=64)
+def required_scope_mask(scope: str) -> int:
+    if unknown := set(scope.split()) - _scope_bits.keys():
+        raise ValueError(f"Unknown scopes in Security(): {unknown}")
+    return granted_scope_mask(scope)
+
+
+class InvalidToken(Exception):
+    pass
+
+
+class VerificationKey(NamedTuple):
+    kid: str
+    alg: str
+    public_key: rsa.RSAPublicKey | ec.EllipticCurvePublicKey | ed25519.Ed25519PublicKey
+
+
+def b64url_decode(data: str | bytes) -> bytes:
+    if isinstance(data, str):
+        data = data.encode("ascii")
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _b64url_int(data: str) -> int:
+    return int.from_bytes(b64url_decode(data), "big")
+
+
+def key_from_jwk(jwk: dict) -> VerificationKey:
+    if not isinstance(jwk.get("kid"), str) or not isinstance(jwk.get("alg"), str):
+        raise ValueError("JWK without kid or alg")
+    match jwk.get("kty"):
+        case "RSA":
+            public_key = rsa.RSAPublicNumbers(_b64url_int(jwk["e"]), _b64url_int(jwk["n"])).public_key()
+        case "EC":
+            public_key = ec.EllipticCurvePublicNumbers(_b64url_int(jwk["x"]), _b64url_int(jwk["y"]),
+                                                       _curves[jwk["crv"]]()).public_key()
+        case "OKP" if jwk.get("crv") == "Ed25519":
+            public_key = ed25519.Ed25519PublicKey.from_public_bytes(b64url_decode(jwk["x"]))
+        case _:
+            raise ValueError(f"Unsupported JWK: {jwk.get('kty')}")
+    return VerificationKey(jwk["kid"], jwk["alg"], public_key)
+
+
+def verify_signature(signing_input: bytes, signature: bytes, key: VerificationKey) -> bool:
+    try:
+        match key.alg[:2], key.alg[2:]:
+            case "RS", bits:
+                key.public_key.verify(signature, signing_input, padding.PKCS1v15(), _hash_algs[bits]())
+            case "ES", bits:
+                size = (key.public_key.curve.key_size + 7) // 8
+                if len(signature) != 2 * size:
+                    return False
+                der = encode_dss_signature(int.from_bytes(signature[:size], "big"),
+                                           int.from_bytes(signature[size:], "big"))
+                key.public_key.verify(der, signing_input, ec.ECDSA(_hash_algs[bits]()))
+            case "Ed", "DSA":
+                key.public_key.verify(signature, signing_input)
+            case _:
+                return False
+    except InvalidSignature:
+        return False
+    return True
+
+
+class JWKSCache:
+    """Ключи сервера авторизации по kid. JWKS загружается при старте и обновляется
+    в фоне; при недоступности сервера продолжаем работать со старым набором
+    (stale-while-revalidate) до jwks_max_stale. На запрос к API сервер
+    авторизации не вызывается: неизвестный kid приводит к внеочередному
+    обновлению не чаще jwks_min_refresh_interval."""
+
+    def __init__(self, jwks_url: str, refresh_interval: float, min_refresh_interval: float, max_stale: float):
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.max_stale = max_stale
+
+        self._keys: dict[str, VerificationKey] = {}
+        self._etag: str | None = None
+        self._fetched_at = 0.0
+        self._attempted_at = float("-inf")
+        self._client: httpx.AsyncClient | None = None
+        self._refresh: asyncio.Task | None = None
+        self._loop_task: asyncio.Task | None = None
+
+    async def _fetch(self):
+        self._attempted_at = time.monotonic()
+        headers = {"If-None-Match": self._etag} if self._etag else {}
+        response = await self._client.get(self.jwks_url, headers=headers)
+        if response.status_code == 304:
+            self._fetched_at = time.monotonic()
+            return
+        response.raise_for_status()
+
+        document = response.json()
+        # Неверный формат — ValueError, refresh() оставит закэшированные ключи
+        if not isinstance(document, dict) or not isinstance(document.get("keys"), list):
+            raise ValueError(f"JWKS from {self.jwks_url} has no \"keys\" list")
+
+        keys = {}
+        for jwk in document["keys"]:
+            if not isinstance(jwk, dict):
+                logger.warning("Skipping malformed JWK %r", jwk)
+                continue
+            try:
+                key = key_from_jwk(jwk)
+            except (KeyError, ValueError, TypeError):
+                logger.warning("Skipping unsupported JWK kid=%s", jwk.get("kid"))
+                continue
+            keys[key.kid] = key
+        self._keys, self._etag, self._fetched_at = keys, response.headers.get("ETag"), time.monotonic()
+        logger.info("Loaded JWKS: %s", ", ".join(keys))
+
+    async def refresh(self):
+        # Параллельные вызовы ждут один и тот же запрос
+        if not self._refresh or self._refresh.done():
+            self._refresh = asyncio.get_running_loop().create_task(self._fetch())
+        try:
+            await asyncio.shield(self._refresh)
+        except (httpx.HTTPError, ValueError, KeyError):
+            logger.warning("JWKS refresh from %s failed, keeping %d cached keys",
+                           self.jwks_url, len(self._keys), exc_info=True)
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await self.refresh()
+
+    async def get(self, kid: str | None) -> VerificationKey | None:
+        if kid in self._keys and not self.stale:
+            return self._keys[kid]
+        if time.monotonic() - self._attempted_at >= self.min_refresh_interval:
+            await self.refresh()
+        return None if self.stale else self._keys.get(kid)
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() - self._fetched_at > self.max_stale
+
+    async def start(self):
+        self._client = httpx.AsyncClient(timeout=5.0)
+        await self.refresh()
+        self._loop_task = asyncio.get_running_loop().create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._loop_task:
+            self._loop_task.cancel()
+        if self._client:
+            await self._client.aclose()
+
+
+async def verify_token(token: str, keys: JWKSCache, issuer: str) -> dict:
+    try:
+        signing_input, signature = token.encode("ascii").rsplit(b".", 1)
+        encoded_header, encoded_claims = signing_input.split(b".", 1)
+        header = orjson.loads(b64url_decode(encoded_header))
+        signature = b64url_decode(signature)
+    except (ValueError, binascii.Error, orjson.JSONDecodeError):
+        raise InvalidToken("Malformed token")
+    if not isinstance(header, dict):
+        raise InvalidToken("Malformed token")
+
+    if not (key := await keys.get(header.get("kid"))):
+        raise InvalidToken("Unknown key id")
+    if header.get("alg") != key.alg or not verify_signature(signing_input, signature, key):
+        raise InvalidToken("Signature verification failed")
+
+    try:
+        claims = orjson.loads(b64url_decode(encoded_claims))
+    except (ValueError, binascii.Error):
+        raise InvalidToken("Invalid payload")
+    if not isinstance(claims, dict) or not isinstance(claims.get("exp"), (int, float)):
+        raise InvalidToken("Invalid payload")
+    if claims["exp"] <= time.time():
+        raise InvalidToken("Token has expired")
+    if claims.get("iss") != issuer:
+        raise InvalidToken("Invalid issuer")
+    return claims
+
+
+def _unauthorized(description: str) -> HTTPException:
+    return HTTPException(status_code=401, detail=description,
+                         headers={"WWW-Authenticate": f'Bearer error="invalid_token", '
+                                                      f'error_description="{description}"'})
+
+
+jwks_cache = JWKSCache(get_settings().auth_server_address.rstrip("/") + "/.well-known/jwks.json",
+                       get_settings().jwks_refresh_interval,
+                       get_settings().jwks_min_refresh_interval,
+                       get_settings().jwks_max_stale)
+token_issuer = (get_settings().auth_server_issuer or get_settings().auth_server_address).rstrip("/")
+bearer = HTTPBearer(auto_error=False)
+
+
+async def get_resourse_owner(security_scopes: SecurityScopes,
+                             credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer)]) -> OwnerSchema:
+    if not credentials:
+        raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+    try:
+        claims = await verify_token(credentials.credentials, jwks_cache, token_issuer)
+    except InvalidToken as e:
+        raise _unauthorized(str(e))
+
+    if not isinstance(scope := claims.get("scope", ""), str):
+        raise _unauthorized("Invalid scope claim")
+    if required_scope_mask(security_scopes.scope_str) & ~granted_scope_mask(scope):
+        raise HTTPException(status_code=403, detail="Insufficient scope",
+                            headers={"WWW-Authenticate": f'Bearer error="insufficient_scope", '
+                                                         f'scope="{security_scopes.scope_str}"'})
+    try:
+        return OwnerSchema(sub=claims.get("sub"), client_id=claims.get("client_id"), scope=scope)
+    except ValidationError:
+        raise _unauthorized("Invalid token claims")
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,9 +13,25 @@ class Settings(BaseSettings):
     db_port: int
     db_name: str
 
+    # Откуда брать JWKS для локальной проверки токенов
+    auth_server_address: str = "http://localhost:8000"
+    # issuer сервера авторизации (claim iss); если не задан — auth_server_address
+    auth_server_issuer: str | None = None
+    jwks_refresh_interval: float = 300.0
+    # Не чаще, чем раз в N секунд, перечитываем JWKS из-за неизвестного kid
+    jwks_min_refresh_interval: float = 30.0
+    # Сколько можно работать со старым JWKS, пока сервер авторизации недоступен
+    jwks_max_stale: float = 86400.0
+
 
 __settings = Settings()
 
+
+@lru_cache()
+def get_settings() -> Settings:
+    return __settings
+
+
 TORTOISE_ORM: dict = {
     "connections": {
         "default": {
@@ -30,7 +47,7 @@ TORTOISE_ORM: dict = {
     },
     "apps": {
         "main": {
-            "models": ["policies_server.main"],
+            "models": ["policies_server.models"],
             "default_connection": "default",
         },
     },
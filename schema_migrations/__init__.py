@@ -0,0 +1,109 @@
+# Версионированные миграции схемы, общие для сервисов (импортируются воркерами при старте, поэтому
+# отдельный пакет, а не dev/). У каждого сервиса в <service>/migrations лежат файлы NNNN_name.sql
+# или NNNN_name.py с async def upgrade(conn), а его __init__.py создаёт Migrations(app_name, каталог).
+# Применяет их python -m dev.migrate; воркер при старте только сверяет версию (check_schema_version)
+# и DDL не выполняет.
+import importlib.util
+import re
+from pathlib import Path
+
+from tortoise import Tortoise
+from tortoise.exceptions import OperationalError
+from tortoise.transactions import in_transaction
+
+_file_pattern = re.compile(r'^(\d{4})_\w+\.(sql|py)$')
+
+create_table = '''CREATE TABLE IF NOT EXISTS "schema_migrations" (
+    "app" VARCHAR(64) NOT NULL,
+    "version" INT NOT NULL,
+    "name" VARCHAR(255) NOT NULL,
+    "applied_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY ("app", "version")
+)'''
+
+
+def _params(conn, count: int) -> str:
+    if conn.capabilities.dialect == 'postgres':
+        return ', '.join(f'${i}' for i in range(1, count + 1))
+    return ', '.join('?' * count)
+
+
+async def _lock(conn):
+    # Параллельные запуски (несколько подов при выкатке) сериализуются; отпускается вместе с транзакцией
+    if conn.capabilities.dialect == 'postgres':
+        await conn.execute_query("SELECT pg_advisory_xact_lock(hashtext('schema_migrations'))")
+
+
+async def _apply(conn, path: Path):
+    if path.suffix == '.sql':
+        await conn.execute_script(path.read_text(encoding='utf-8'))
+        return
+    # Имя файла начинается с цифр, обычным import его не загрузить
+    spec = importlib.util.spec_from_file_location(f"migration_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    await module.upgrade(conn)
+
+
+class Migrations:
+    def __init__(self, app_name: str, path: Path):
+        self.app_name = app_name
+        self.path = path
+
+    def files(self) -> dict[int, Path]:
+        """Версия -> файл миграции, по возрастанию версии."""
+        found = {}
+        for file in sorted(self.path.iterdir()):
+            if match := _file_pattern.match(file.name):
+                version = int(match[1])
+                if version in found:
+                    raise RuntimeError(f"duplicate migration version {version}: {found[version].name}, {file.name}")
+                found[version] = file
+        return found
+
+    async def applied_versions(self, conn) -> set[int]:
+        _, rows = await conn.execute_query(f"SELECT version FROM schema_migrations WHERE app = {_params(conn, 1)}",
+                                           [self.app_name])
+        return {row[0] for row in rows}
+
+    async def schema_version(self) -> int:
+        conn = Tortoise.get_connection('default')
+        try:
+            _, rows = await conn.execute_query(
+                    f"SELECT MAX(version) FROM schema_migrations WHERE app = {_params(conn, 1)}", [self.app_name])
+        except OperationalError:  # таблицы ещё нет — база не мигрирована
+            return 0
+        return rows[0][0] or 0
+
+    async def check_schema_version(self):
+        # База новее кода допустима: при выкатке миграции применяются раньше, чем обновятся все воркеры
+        current, expected = await self.schema_version(), max(self.files())
+        if current < expected:
+            raise RuntimeError(f"database schema is at version {current}, {self.app_name} needs {expected}: "
+                               f"run python -m dev.migrate {self.app_name}")
+
+    async def status(self) -> dict[Path, bool]:
+        async with in_transaction() as conn:
+            await _lock(conn)
+            await conn.execute_script(create_table)
+            applied = await self.applied_versions(conn)
+        return {path: version in applied for version, path in self.files().items()}
+
+    async def upgrade(self, target: int | None = None):
+        """Каждая миграция — в своей транзакции вместе с записью версии в schema_migrations."""
+        applied = {path for path, done in (await self.status()).items() if done}
+        pending = {version: path for version, path in self.files().items()
+                   if path not in applied and (target is None or version <= target)}
+        if not pending:
+            print(f"{self.app_name}: up to date (version {await self.schema_version()})")
+        for version, path in pending.items():
+            async with in_transaction() as conn:
+                await _lock(conn)
+                # Пока ждали блокировку, миграцию мог применить другой процесс
+                if version in await self.applied_versions(conn):
+                    print(f"{self.app_name}: {path.name} already applied")
+                    continue
+                await _apply(conn, path)
+                await conn.execute_query(f"INSERT INTO schema_migrations (app, version, name) "
+                                         f"VALUES ({_params(conn, 3)})", [self.app_name, version, path.stem])
+            print(f"{self.app_name}: applied {path.name}")